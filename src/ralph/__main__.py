@@ -0,0 +1,25 @@
+"""Ralph CLI launcher.
+
+This module is the console-script entry point. It answers a bare
+``ralph --version`` without importing Typer, and hands every other
+invocation to the Typer application in ``ralph.cli``.
+"""
+
+import sys
+
+from ralph import __version__
+
+
+def main() -> None:
+    """Run the Ralph CLI."""
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        print(f"ralph {__version__}")
+        return
+
+    from ralph.cli import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
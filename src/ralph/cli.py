@@ -4,17 +4,113 @@ This module provides the main entry point for the Ralph CLI application,
 a tool for autonomous iteration patterns with Claude Code.
 """
 
-import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 import typer
+from typer.core import TyperCommand, TyperGroup
 
 from ralph import __version__
-from ralph.commands import init, loop, once, prd, review, sync, tasks
+from ralph.commands import COMMANDS, load_command
+
+if TYPE_CHECKING:
+    import click
+    from click.shell_completion import CompletionItem
+
+
+class LazyCommandGroup(TyperGroup):
+    """Click group that imports a command's module only when it is run.
+
+    Command names and help text come from the COMMANDS registry, so
+    listing commands in help output or shell completion never imports a
+    command module.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the group with no commands built yet.
+
+        Args:
+            **kwargs: Keyword arguments passed through to TyperGroup.
+        """
+        super().__init__(**kwargs)
+        self._listing = False
+
+    @contextmanager
+    def _listing_only(self) -> Iterator[None]:
+        """Make get_command return help-only placeholders while active."""
+        self._listing = True
+        try:
+            yield
+        finally:
+            self._listing = False
+
+    def list_commands(self, ctx: "click.Context") -> list[str]:
+        """Return the registered command names in registry order.
+
+        Args:
+            ctx: The click context.
+
+        Returns:
+            List of command names.
+        """
+        return list(COMMANDS)
+
+    def get_command(self, ctx: "click.Context", cmd_name: str) -> "click.Command | None":
+        """Return the click command for a name, importing its module on first use.
+
+        While commands are only being listed, a placeholder carrying only
+        the help text is returned instead so the module is not imported.
+
+        Args:
+            ctx: The click context.
+            cmd_name: The command name.
+
+        Returns:
+            The click command, or None if the name is not registered.
+        """
+        if cmd_name not in COMMANDS:
+            return None
+
+        _, _, command_help = COMMANDS[cmd_name]
+        if self._listing:
+            return TyperCommand(name=cmd_name, help=command_help)
+
+        command = self.commands.get(cmd_name)
+        if command is None:
+            single = typer.Typer(add_completion=False)
+            single.command(name=cmd_name, help=command_help)(load_command(cmd_name))
+            command = typer.main.get_command(single)
+            self.commands[cmd_name] = command
+        return command
+
+    def format_help(self, ctx: "click.Context", formatter: "click.HelpFormatter") -> None:
+        """Render group help from registry metadata without importing commands.
+
+        Args:
+            ctx: The click context.
+            formatter: The click help formatter.
+        """
+        with self._listing_only():
+            super().format_help(ctx, formatter)
+
+    def shell_complete(self, ctx: "click.Context", incomplete: str) -> list["CompletionItem"]:
+        """Complete command names from registry metadata without importing commands.
+
+        Args:
+            ctx: The click context.
+            incomplete: The partial word being completed.
+
+        Returns:
+            Completion items for matching commands and options.
+        """
+        with self._listing_only():
+            return super().shell_complete(ctx, incomplete)
 
-logger = logging.getLogger(__name__)
 
 app = typer.Typer(
     name="ralph",
+    cls=LazyCommandGroup,
     help="Ralph CLI - Autonomous iteration pattern for Claude Code",
     no_args_is_help=True,
 )
@@ -48,14 +144,5 @@ def main(
     """Ralph CLI - Autonomous iteration pattern for Claude Code."""
 
 
-app.command(name="init", help="Scaffold a project for Ralph workflow")(init)
-app.command(name="prd", help="Create a PRD interactively with Claude")(prd)
-app.command(name="tasks", help="Convert a specification file to TASKS.json")(tasks)
-app.command(name="once", help="Execute a single Ralph iteration")(once)
-app.command(name="loop", help="Run multiple Ralph iterations automatically")(loop)
-app.command(name="sync", help="Sync Ralph skills to Claude Code")(sync)
-app.command(name="review", help="Run the review loop with automatic configuration")(review)
-
-
 if __name__ == "__main__":
     app()
@@ -1,11 +1,44 @@
-"""Ralph CLI commands."""
+"""Ralph CLI commands.
 
-from ralph.commands.init_cmd import init
-from ralph.commands.loop import loop
-from ralph.commands.once import once
-from ralph.commands.prd import prd
-from ralph.commands.review import review
-from ralph.commands.sync import sync
-from ralph.commands.tasks import tasks
+Command implementations are imported on demand so that building the CLI
+does not pull in every command's dependencies up front. Use
+``load_command`` to resolve a command callback by its CLI name.
+"""
 
-__all__ = ["init", "prd", "tasks", "once", "loop", "sync", "review"]
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+# Maps CLI command name to (module path, callback attribute, help text)
+COMMANDS: dict[str, tuple[str, str, str]] = {
+    "init": ("ralph.commands.init_cmd", "init", "Scaffold a project for Ralph workflow"),
+    "prd": ("ralph.commands.prd", "prd", "Create a PRD interactively with Claude"),
+    "tasks": ("ralph.commands.tasks", "tasks", "Convert a specification file to TASKS.json"),
+    "once": ("ralph.commands.once", "once", "Execute a single Ralph iteration"),
+    "loop": ("ralph.commands.loop", "loop", "Run multiple Ralph iterations automatically"),
+    "sync": ("ralph.commands.sync", "sync", "Sync Ralph skills to Claude Code"),
+    "review": (
+        "ralph.commands.review",
+        "review",
+        "Run the review loop with automatic configuration",
+    ),
+}
+
+
+def load_command(name: str) -> Callable[..., Any]:
+    """Import and return the callback for a CLI command.
+
+    Args:
+        name: The CLI command name (e.g., 'init', 'loop').
+
+    Returns:
+        The command callback function.
+
+    Raises:
+        KeyError: If the command name is not registered.
+    """
+    module_path, attr, _ = COMMANDS[name]
+    return getattr(import_module(module_path), attr)
+
+
+__all__ = ["COMMANDS", "load_command"]
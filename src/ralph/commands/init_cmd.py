@@ -5,40 +5,95 @@ the plans directory structure and configuration files.
 """
 
 import logging
+import os
+import re
 import subprocess
 from pathlib import Path
 
 import typer
 from rich.prompt import Confirm
+from rich.text import Text
 
 from ralph.commands.prd import prd as prd_command
-from ralph.services import ClaudeError, ClaudeService, ProjectType, ScaffoldService
+from ralph.services import (
+    ClaudeError,
+    ClaudeService,
+    GitError,
+    GitService,
+    ProjectType,
+    ScaffoldService,
+    find_git_dir,
+)
 from ralph.utils import console, print_success, print_warning
 
 logger = logging.getLogger(__name__)
 
+# Workflow files reported by _check_existing_files, in display order
+_WORKFLOW_FILES = (
+    "plans/SPEC.md",
+    "plans/TASKS.json",
+    "plans/PROGRESS.txt",
+    "CLAUDE.md",
+    "AGENTS.md",
+    "CHANGELOG.md",
+)
+
+# Placeholder markers the scaffold template uses in brackets
+_PRD_PLACEHOLDERS = (
+    "[Describe the feature",
+    "[Goal 1]",
+    "[Requirement 1]",
+    "[What this feature will NOT do]",
+    "[Describe the high-level architecture]",
+)
+# Explicit template comment markers
+_PRD_TEMPLATE_MARKERS = (
+    "<!-- Replace this",
+    "[Your feature",
+)
+# Any match means SPEC.md still holds template content
+_TEMPLATE_MARKER_RE = re.compile(
+    "|".join(map(re.escape, _PRD_PLACEHOLDERS + _PRD_TEMPLATE_MARKERS))
+)
+_SECTION_HEADING_RE = re.compile(r"^## ", re.MULTILINE)
+_PRD_PREFIX_BYTES = 4096
+
+# Closing guidance printed after a successful init, parsed once at import
+_NEXT_STEPS = Text.from_markup(
+    "[bold]Next steps:[/bold]\n"
+    "  1. Edit [cyan]plans/SPEC.md[/cyan] with your feature specification\n"
+    "     Or run [cyan]ralph prd[/cyan] to create one interactively\n"
+    "\n"
+    "  2. Generate tasks from your spec:\n"
+    "     [cyan]ralph tasks plans/SPEC.md[/cyan]\n"
+    "\n"
+    "  3. Start the autonomous iteration loop:\n"
+    "     [cyan]ralph loop[/cyan]\n"
+    "\n"
+    "[dim]Tip: Review CLAUDE.md to customize quality checks for your project.[/dim]"
+)
+
 
 def _is_git_repo(project_root: Path) -> bool:
     """Check if the directory is inside a git repository.
 
+    Uses find_git_dir, so no git process is needed in the common case.
+    Defers to git when GIT_DIR is set, since it overrides discovery.
+
     Args:
         project_root: The directory to check.
 
     Returns:
         True if inside a git repo, False otherwise.
     """
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
-        # git not installed
-        return False
+    if "GIT_DIR" in os.environ:
+        try:
+            GitService(working_dir=project_root).get_git_dir()
+        except GitError:
+            return False
+        return True
+
+    return find_git_dir(project_root) is not None
 
 
 def _init_git_repo(project_root: Path) -> bool:
@@ -84,8 +139,9 @@ def _create_initial_commit(project_root: Path) -> bool:
             logger.warning(f"git add failed: {add_result.stderr}")
             return False
 
+        # --quiet skips the per-file summary git would otherwise compute
         commit_result = subprocess.run(
-            ["git", "commit", "-m", "Initial commit: Ralph workflow setup"],
+            ["git", "commit", "--quiet", "-m", "Initial commit: Ralph workflow setup"],
             cwd=project_root,
             capture_output=True,
             text=True,
@@ -117,8 +173,9 @@ def init(
     """
     project_root = Path.cwd()
 
-    existing_files = _check_existing_files(project_root)
-    if existing_files and not force:
+    # With --force existing files are overwritten, so there is nothing to check
+    existing_files = [] if force else _check_existing_files(project_root)
+    if existing_files:
         print_warning("Ralph workflow files already exist:")
         for file in existing_files:
             console.print(f"  - {file}")
@@ -148,13 +205,12 @@ def init(
     prd_path = project_root / "plans" / "SPEC.md"
     had_prd_content_before = _has_prd_content(prd_path)
 
-    console.print()
-    console.print("[bold]Creating Ralph workflow files...[/bold]")
+    console.print("\n[bold]Creating Ralph workflow files...[/bold]")
 
     # Skip CHANGELOG.md creation if it already exists (it's persistent memory)
     changelog_existed = (project_root / "CHANGELOG.md").exists()
     created_files = scaffold.scaffold_all(
-        project_name=project_name, skip_changelog=changelog_existed
+        project_name=project_name, skip_changelog=changelog_existed, project_type=project_type
     )
 
     for file_type, path in created_files.items():
@@ -201,38 +257,22 @@ def init(
     console.print()
     print_success("[bold]Ralph workflow initialized![/bold]")
     console.print()
-    console.print("[bold]Next steps:[/bold]")
-    console.print("  1. Edit [cyan]plans/SPEC.md[/cyan] with your feature specification")
-    console.print("     Or run [cyan]ralph prd[/cyan] to create one interactively")
-    console.print()
-    console.print("  2. Generate tasks from your spec:")
-    console.print("     [cyan]ralph tasks plans/SPEC.md[/cyan]")
-    console.print()
-    console.print("  3. Start the autonomous iteration loop:")
-    console.print("     [cyan]ralph loop[/cyan]")
-    console.print()
-    console.print("[dim]Tip: Review CLAUDE.md to customize quality checks for your project.[/dim]")
+    console.print(_NEXT_STEPS)
 
 
 def _check_existing_files(project_root: Path) -> list[str]:
     """Check for existing Ralph workflow files.
 
+    Uses exists() so a differently-cased file such as claude.md still
+    counts on case-insensitive filesystems.
+
     Args:
         project_root: The project root directory.
 
     Returns:
         List of relative paths to existing files.
     """
-    files_to_check = [
-        "plans/SPEC.md",
-        "plans/TASKS.json",
-        "plans/PROGRESS.txt",
-        "CLAUDE.md",
-        "AGENTS.md",
-        "CHANGELOG.md",
-    ]
-
-    return [f for f in files_to_check if (project_root / f).exists()]
+    return [f for f in _WORKFLOW_FILES if (project_root / f).exists()]
 
 
 def _has_prd_content(prd_path: Path) -> bool:
@@ -248,61 +288,48 @@ def _has_prd_content(prd_path: Path) -> bool:
     Returns:
         True if the file has meaningful content, False otherwise.
     """
-    if not prd_path.exists():
+    try:
+        with open(prd_path, "rb") as f:
+            # Untouched templates show a marker near the top, so check a
+            # prefix before reading the rest of the file
+            head = f.read(_PRD_PREFIX_BYTES)
+            if _TEMPLATE_MARKER_RE.search(head.decode("utf-8", errors="replace")):
+                return False
+            data = head + f.read()
+    except (FileNotFoundError, IsADirectoryError):
         return False
 
-    content = prd_path.read_text().strip()
+    content = data.decode("utf-8", errors="replace").strip()
 
     # Empty file has no content
     if not content:
         return False
 
-    # The scaffold template uses placeholder markers in brackets like:
-    # [Describe the feature or project you want to build]
-    # [Goal 1], [Goal 2], [Requirement 1], etc.
-    # If the file still contains these, it hasn't been filled in
-    placeholder_patterns = [
-        "[Describe the feature",
-        "[Goal 1]",
-        "[Requirement 1]",
-        "[What this feature will NOT do]",
-        "[Describe the high-level architecture]",
-    ]
-
-    # Check if any scaffold placeholder patterns are still present
-    has_placeholders = any(pattern in content for pattern in placeholder_patterns)
-
-    # If it has placeholders, it's still template content
-    if has_placeholders:
+    # If the file still contains scaffold placeholders or template markers,
+    # it hasn't been filled in
+    if _TEMPLATE_MARKER_RE.search(content):
         return False
 
-    # Also check for explicit template comment markers
-    template_markers = [
-        "<!-- Replace this",
-        "[Your feature",
-    ]
+    # Check for actual content: must have at least one section heading followed
+    # by actual text (not just another heading or placeholder)
+    heading = _SECTION_HEADING_RE.search(content)
+    if heading is None:
+        return False
 
-    if any(marker in content for marker in template_markers):
+    body_start = content.find("\n", heading.end())
+    if body_start == -1:
         return False
 
-    # Check for actual content: must have at least one section heading followed
-    # by actual text (not just another heading or placeholder)
-    lines = content.split("\n")
-    for i, line in enumerate(lines):
-        if line.startswith("## "):  # Section heading
-            # Check if there's actual content after this heading
-            for remaining in lines[i + 1 :]:
-                stripped = remaining.strip()
-                # Skip empty lines and subheadings
-                if not stripped or stripped.startswith("#"):
-                    continue
-                # Found actual content line
-                # Make sure it's not just a placeholder bracket
-                if stripped.startswith("[") and stripped.endswith("]"):
-                    continue
-                # Found real content
-                return True
-            break
+    for line in content[body_start + 1 :].split("\n"):
+        stripped = line.strip()
+        # Skip empty lines and subheadings
+        if not stripped or stripped.startswith("#"):
+            continue
+        # Make sure it's not just a placeholder bracket
+        if stripped.startswith("[") and stripped.endswith("]"):
+            continue
+        # Found real content
+        return True
 
     return False
 
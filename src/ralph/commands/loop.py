@@ -14,15 +14,17 @@ from pydantic import ValidationError
 
 from ralph.commands.once import (
     _build_prompt_from_skill,
+    _CompletionWatcher,
     _find_next_story,
 )
 from ralph.models import (
     REVIEW_STATE_FILENAME,
+    ReviewerConfig,
     ReviewState,
     TasksFile,
     UserStory,
     load_reviewer_configs,
-    load_tasks,
+    load_tasks_cached,
 )
 from ralph.models.finding import Verdict
 from ralph.services import (
@@ -92,22 +94,20 @@ class LoopStopReason(StrEnum):
 
 def _execute_story(
     *,
-    project_root: Path,
+    claude: ClaudeService,
     tasks_path: Path,
     story: UserStory,
     max_fix_attempts: int,
-    verbose: bool,
 ) -> IterationOutcome:
     """Execute a single story iteration with Claude.
 
     Builds the prompt, runs Claude, and checks whether the story passed.
 
     Args:
-        project_root: Path to the project root directory.
+        claude: ClaudeService shared across the loop's iterations.
         tasks_path: Path to TASKS.json for status verification.
         story: The UserStory to implement.
         max_fix_attempts: Maximum attempts to fix failing checks.
-        verbose: Whether to show verbose output.
 
     Returns:
         IterationOutcome indicating what happened during execution.
@@ -118,13 +118,14 @@ def _execute_story(
         print_error(f"Skill not found: {e}")
         return IterationOutcome.SKILL_ERROR
 
+    watcher = _CompletionWatcher()
     try:
-        claude = ClaudeService(working_dir=project_root, verbose=verbose)
-        output_text, _ = claude.run_print_mode(
+        claude.run_print_mode(
             prompt,
             stream=True,
             skip_permissions=True,
             append_system_prompt=ClaudeService.AUTONOMOUS_MODE_PROMPT,
+            on_text=watcher,
         )
     except ClaudeError as e:
         print_error(f"Claude error: {e}")
@@ -132,7 +133,7 @@ def _execute_story(
 
     console.print()
 
-    if "<ralph>COMPLETE</ralph>" in output_text:
+    if watcher.found:
         return IterationOutcome.ALL_COMPLETE
 
     story_passed = _check_story_status(tasks_path, story.id)
@@ -145,9 +146,25 @@ def _execute_story(
     return IterationOutcome.FAILED
 
 
+def _count_stories(tasks: TasksFile) -> tuple[int, int]:
+    """Count total and passing stories.
+
+    Args:
+        tasks: The TasksFile to count.
+
+    Returns:
+        Tuple of (total, completed) story counts.
+    """
+    total = len(tasks.user_stories)
+    completed = sum(1 for s in tasks.user_stories if s.passes)
+    return total, completed
+
+
 def _check_story_status(tasks_path: Path, story_id: str) -> bool:
     """Check if a story has passed by reloading TASKS.json.
 
+    The file is only re-parsed if Claude changed it during the iteration.
+
     Args:
         tasks_path: Path to TASKS.json.
         story_id: ID of the story to check.
@@ -156,8 +173,8 @@ def _check_story_status(tasks_path: Path, story_id: str) -> bool:
         True if the story passes, False otherwise.
     """
     try:
-        updated_tasks = load_tasks(tasks_path)
-        updated_story = next((s for s in updated_tasks.user_stories if s.id == story_id), None)
+        updated_tasks = load_tasks_cached(tasks_path)
+        updated_story = updated_tasks.stories_by_id.get(story_id)
         return updated_story is not None and updated_story.passes
     except (FileNotFoundError, ValidationError, OSError) as e:
         logger.warning(f"Could not verify story status: {e}")
@@ -186,22 +203,22 @@ def _display_loop_summary(
     Returns:
         Tuple of (final_completed, final_remaining) counts.
     """
-    console.print("[bold]Loop Summary[/bold]")
-    console.print()
-
     try:
-        final_tasks = load_tasks(tasks_path)
-        final_completed = sum(1 for s in final_tasks.user_stories if s.passes)
+        final_tasks = load_tasks_cached(tasks_path)
+        _, final_completed = _count_stories(final_tasks)
         final_remaining = total_stories - final_completed
     except (FileNotFoundError, ValidationError, OSError) as e:
         logger.warning(f"Could not load final task status: {e}")
         final_completed = completed_before + completed_in_loop
         final_remaining = total_stories - final_completed
 
-    console.print(f"[dim]Stories completed this run:[/dim] {completed_in_loop}")
-    console.print(f"[dim]Total completed:[/dim] {final_completed}/{total_stories}")
-    console.print(f"[dim]Remaining:[/dim] {final_remaining}")
-    console.print()
+    console.print(
+        "[bold]Loop Summary[/bold]\n"
+        "\n"
+        f"[dim]Stories completed this run:[/dim] {completed_in_loop}\n"
+        f"[dim]Total completed:[/dim] {final_completed}/{total_stories}\n"
+        f"[dim]Remaining:[/dim] {final_remaining}\n"
+    )
 
     if stop_reason == LoopStopReason.MAX_ITERATIONS:
         console.print(f"[dim]Reached maximum of {iterations} iterations.[/dim]")
@@ -215,7 +232,7 @@ def _display_loop_summary(
 
 
 def _reload_tasks(tasks_path: Path) -> TasksFile | None:
-    """Reload TASKS.json from disk.
+    """Reload TASKS.json, reusing the last parse if the file is unchanged.
 
     Args:
         tasks_path: Path to TASKS.json.
@@ -224,7 +241,7 @@ def _reload_tasks(tasks_path: Path) -> TasksFile | None:
         TasksFile if loaded successfully, None on error.
     """
     try:
-        return load_tasks(tasks_path)
+        return load_tasks_cached(tasks_path)
     except (FileNotFoundError, ValidationError, OSError) as e:
         logger.error(f"Failed to reload TASKS.json: {e}")
         print_error("Failed to reload TASKS.json")
@@ -258,6 +275,81 @@ def _check_consecutive_failures(
     return LoopStopReason.MAX_ITERATIONS, False
 
 
+def _resolve_git_dir(git: GitService) -> Path | None:
+    """Resolve the repository's git directory once for the branch guard.
+
+    Args:
+        git: GitService instance.
+
+    Returns:
+        Absolute path to the git directory, or None if git cannot report it.
+    """
+    try:
+        return git.get_git_dir()
+    except GitError as e:
+        logger.warning(f"Could not resolve git directory: {e}")
+        return None
+
+
+def _head_mtime_ns(git_dir: Path | None) -> int | None:
+    """Get the modification time of the repository's HEAD file.
+
+    Args:
+        git_dir: Absolute path to the git directory, if known.
+
+    Returns:
+        The st_mtime_ns of HEAD in the git directory, or None if it cannot
+        be read.
+    """
+    if git_dir is None:
+        return None
+    try:
+        return (git_dir / "HEAD").stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _check_branch_unchanged(
+    git: GitService,
+    git_dir: Path | None,
+    branch_name: str,
+    head_mtime_ns: int | None,
+) -> tuple[int | None, bool]:
+    """Check that the feature branch is still checked out.
+
+    git is only queried when HEAD changed since the last check, since
+    switching branches rewrites that file. If HEAD cannot be stat'ed it is
+    treated as changed. A mismatch is reported here.
+
+    Args:
+        git: GitService instance.
+        git_dir: Absolute path to the git directory, if known.
+        branch_name: Expected branch name from TASKS.json.
+        head_mtime_ns: HEAD modification time seen at the last check.
+
+    Returns:
+        Tuple of (head_mtime_ns, should_break). If should_break is True,
+        the loop should terminate with LoopStopReason.BRANCH_MISMATCH.
+    """
+    current_mtime_ns = _head_mtime_ns(git_dir)
+    if current_mtime_ns is not None and current_mtime_ns == head_mtime_ns:
+        return head_mtime_ns, False
+
+    try:
+        current_branch = git.get_current_branch()
+    except GitError as e:
+        logger.warning(f"Could not verify current branch: {e}")
+        return current_mtime_ns, False
+
+    if current_branch != branch_name:
+        print_error(
+            f"Branch changed to '{current_branch}' during the loop (expected '{branch_name}')."
+        )
+        return current_mtime_ns, True
+
+    return current_mtime_ns, False
+
+
 def loop(
     iterations: int = typer.Argument(10, help="Number of iterations to run"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show full JSON output"),
@@ -303,7 +395,7 @@ def loop(
         raise typer.Exit(1)
 
     try:
-        tasks = load_tasks(tasks_path)
+        tasks = load_tasks_cached(tasks_path)
     except FileNotFoundError:
         print_error("Could not load plans/TASKS.json")
         raise typer.Exit(1)
@@ -318,25 +410,26 @@ def loop(
         print_error("Could not set up the feature branch. Aborting loop.")
         raise typer.Exit(1)
 
-    console.print("[bold]Ralph Loop[/bold]")
-    console.print()
-    console.print(f"[dim]Project:[/dim] {tasks.project}")
-    console.print(f"[dim]Branch:[/dim] {tasks.branch_name}")
-    console.print(f"[dim]Max iterations:[/dim] {iterations}")
-    console.print()
+    branch_name = tasks.branch_name
+    git_dir = _resolve_git_dir(git)
+    head_mtime_ns = _head_mtime_ns(git_dir)
 
-    total_stories = len(tasks.user_stories)
-    completed_before = sum(1 for s in tasks.user_stories if s.passes)
+    total_stories, completed_before = _count_stories(tasks)
     remaining = total_stories - completed_before
 
-    console.print(f"[dim]Total stories:[/dim] {total_stories}")
-    console.print(f"[dim]Already complete:[/dim] {completed_before}")
-    console.print(f"[dim]Remaining:[/dim] {remaining}")
-    console.print()
     console.print(
-        "[dim]Running Claude with auto-approved permissions for autonomous iteration[/dim]"
+        "[bold]Ralph Loop[/bold]\n"
+        "\n"
+        f"[dim]Project:[/dim] {tasks.project}\n"
+        f"[dim]Branch:[/dim] {tasks.branch_name}\n"
+        f"[dim]Max iterations:[/dim] {iterations}\n"
+        "\n"
+        f"[dim]Total stories:[/dim] {total_stories}\n"
+        f"[dim]Already complete:[/dim] {completed_before}\n"
+        f"[dim]Remaining:[/dim] {remaining}\n"
+        "\n"
+        "[dim]Running Claude with auto-approved permissions for autonomous iteration[/dim]\n"
     )
-    console.print()
 
     if remaining == 0:
         print_success("All stories already complete!")
@@ -346,10 +439,18 @@ def loop(
     failed_story_id: str | None = None
     consecutive_failures = 0
     stop_reason: LoopStopReason = LoopStopReason.MAX_ITERATIONS
+    claude = ClaudeService(working_dir=project_root, verbose=verbose)
 
     for i in range(iterations):
         iteration_num = i + 1
 
+        head_mtime_ns, should_break = _check_branch_unchanged(
+            git, git_dir, branch_name, head_mtime_ns
+        )
+        if should_break:
+            stop_reason = LoopStopReason.BRANCH_MISMATCH
+            break
+
         tasks = _reload_tasks(tasks_path)
         if tasks is None:
             stop_reason = LoopStopReason.TRANSIENT_FAILURE
@@ -374,11 +475,10 @@ def loop(
         console.print()
 
         outcome = _execute_story(
-            project_root=project_root,
+            claude=claude,
             tasks_path=tasks_path,
             story=next_story,
             max_fix_attempts=max_fix_attempts,
-            verbose=verbose,
         )
 
         if outcome == IterationOutcome.ALL_COMPLETE:
@@ -413,9 +513,16 @@ def loop(
     if stop_reason == LoopStopReason.ALL_COMPLETE:
         print_success("All stories complete!")
 
+        # The final iteration may have switched branches, so check before reviewing
+        branch_changed = False
+        if not skip_review:
+            _, branch_changed = _check_branch_unchanged(git, git_dir, branch_name, head_mtime_ns)
+
         # Run review loop unless skipped
         if skip_review:
             console.print("[dim]Skipping review loop (--skip-review flag)[/dim]")
+        elif branch_changed:
+            console.print("[dim]Skipping review loop (feature branch not checked out)[/dim]")
         else:
             review_success = _run_review_loop(
                 project_root=project_root,
@@ -595,6 +702,7 @@ def _run_review_loop(
     # Run each reviewer with progress display
     results: list[ReviewerResult] = []
     total_reviewers = len(reviewers)
+    pending_skipped: list[ReviewerConfig] = []
 
     for i, reviewer in enumerate(reviewers, start=1):
         # Check if reviewer should be skipped due to language filter
@@ -609,7 +717,7 @@ def _run_review_loop(
                 attempts=0,
             )
             results.append(result)
-            review_service._append_review_summary(progress_path, reviewer, result)
+            pending_skipped.append(reviewer)
             continue
 
         # Skip already-completed reviewers when resuming
@@ -625,6 +733,9 @@ def _run_review_loop(
             results.append(result)
             continue
 
+        review_service._append_skipped_summaries(progress_path, pending_skipped)
+        pending_skipped.clear()
+
         # Display progress counter and reviewer name
         print_review_step(i, total_reviewers, reviewer.name)
         console.print()
@@ -681,10 +792,10 @@ def _run_review_loop(
 
         console.print()
 
+    review_service._append_skipped_summaries(progress_path, pending_skipped)
+
     # Display summary
-    console.print()
-    console.print("[bold]Review Summary[/bold]")
-    console.print()
+    summary_lines = ["", "[bold]Review Summary[/bold]", ""]
 
     passed = 0
     failed = 0
@@ -694,28 +805,31 @@ def _run_review_loop(
     for result in results:
         if result.skipped:
             skipped += 1
-            console.print(f"  [dim]- {result.reviewer_name}: skipped (language filter)[/dim]")
+            summary_lines.append(
+                f"  [dim]- {result.reviewer_name}: skipped (language filter)[/dim]"
+            )
         elif result.fix_skipped:
             skipped_fix += 1
-            console.print(
+            summary_lines.append(
                 f"  [yellow][FINDINGS][/yellow] {result.reviewer_name}: findings (not fixed)"
             )
         elif result.success:
             passed += 1
-            console.print(f"  [green][OK][/green] {result.reviewer_name}: passed")
+            summary_lines.append(f"  [green][OK][/green] {result.reviewer_name}: passed")
         else:
             failed += 1
             error_info = f" ({result.error})" if result.error else ""
             attempts_text = f"failed after {result.attempts} attempt(s)"
-            console.print(
+            summary_lines.append(
                 f"  [red][FAIL][/red] {result.reviewer_name}: {attempts_text}{error_info}"
             )
 
-    console.print()
     summary_parts = [f"Passed: {passed}", f"Failed: {failed}", f"Skipped: {skipped}"]
     if skipped_fix > 0:
         summary_parts.append(f"Findings (not fixed): {skipped_fix}")
-    console.print(f"[dim]{', '.join(summary_parts)}[/dim]")
+    summary_lines.append("")
+    summary_lines.append(f"[dim]{', '.join(summary_parts)}[/dim]")
+    console.print("\n".join(summary_lines))
 
     # Clean up state file on successful completion
     if state_path.exists():
@@ -11,7 +11,7 @@ from pathlib import Path
 import typer
 from pydantic import ValidationError
 
-from ralph.models import TasksFile, UserStory, load_tasks
+from ralph.models import TasksFile, UserStory, load_tasks_cached
 from ralph.services import ClaudeError, ClaudeService, SkillNotFoundError
 from ralph.utils import (
     append_file,
@@ -25,6 +25,38 @@ from ralph.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Tag Claude prints once every story in TASKS.json passes
+_COMPLETE_SIGNAL = "<ralph>COMPLETE</ralph>"
+
+
+class _CompletionWatcher:
+    """Detect the completion signal in streamed Claude output.
+
+    Only a tail shorter than the signal is kept between chunks, so the
+    signal is found even when split across chunks without holding the
+    full transcript in memory.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the watcher with no text seen yet."""
+        self.found = False
+        self._tail = ""
+
+    def __call__(self, text: str) -> None:
+        """Scan a streamed chunk for the completion signal.
+
+        Args:
+            text: The next chunk of streamed output.
+        """
+        if self.found:
+            return
+        window = self._tail + text
+        if _COMPLETE_SIGNAL in window:
+            self.found = True
+            self._tail = ""
+        else:
+            self._tail = window[-(len(_COMPLETE_SIGNAL) - 1) :]
+
 
 def once(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show full JSON output"),
@@ -46,7 +78,7 @@ def once(
         raise typer.Exit(1)
 
     try:
-        tasks = load_tasks(tasks_path)
+        tasks = load_tasks_cached(tasks_path)
     except FileNotFoundError:
         print_error("Could not load plans/TASKS.json")
         raise typer.Exit(1)
@@ -54,7 +86,7 @@ def once(
         print_error(f"Error parsing TASKS.json: {e}")
         raise typer.Exit(1)
 
-    next_story = _find_next_story(tasks)
+    next_story, incomplete_count = _scan_stories(tasks)
 
     if next_story is None:
         print_success("All stories complete!")
@@ -62,24 +94,23 @@ def once(
         console.print("[dim]No more stories to implement.[/dim]")
         raise typer.Exit(0)
 
-    console.print("[bold]Ralph Iteration[/bold]")
-    console.print()
-    console.print(f"[dim]Project:[/dim] {tasks.project}")
-    console.print(f"[dim]Branch:[/dim] {tasks.branch_name}")
-    console.print()
-    console.print("[bold]Story to implement:[/bold]")
-    console.print(f"  [cyan]{next_story.id}[/cyan]: {next_story.title}")
-    console.print(f"  [dim]{next_story.description}[/dim]")
-    console.print()
-
-    console.print("[bold]Acceptance Criteria:[/bold]")
-    for criterion in next_story.acceptance_criteria:
-        console.print(f"  - {criterion}")
-    console.print()
-
-    incomplete_count = sum(1 for s in tasks.user_stories if not s.passes)
-    console.print(f"[dim]Stories remaining: {incomplete_count}[/dim]")
-    console.print()
+    header_lines = [
+        "[bold]Ralph Iteration[/bold]",
+        "",
+        f"[dim]Project:[/dim] {tasks.project}",
+        f"[dim]Branch:[/dim] {tasks.branch_name}",
+        "",
+        "[bold]Story to implement:[/bold]",
+        f"  [cyan]{next_story.id}[/cyan]: {next_story.title}",
+        f"  [dim]{next_story.description}[/dim]",
+        "",
+        "[bold]Acceptance Criteria:[/bold]",
+        *(f"  - {criterion}" for criterion in next_story.acceptance_criteria),
+        "",
+        f"[dim]Stories remaining: {incomplete_count}[/dim]",
+        "",
+    ]
+    console.print("\n".join(header_lines))
 
     try:
         prompt = _build_prompt_from_skill(next_story, max_fix_attempts)
@@ -87,19 +118,20 @@ def once(
         print_error(f"Skill not found: {e}")
         raise typer.Exit(1) from e
 
-    console.print("[bold]Running Claude Code...[/bold]")
     console.print(
-        "[dim]Running Claude with auto-approved permissions for autonomous iteration[/dim]"
+        "[bold]Running Claude Code...[/bold]\n"
+        "[dim]Running Claude with auto-approved permissions for autonomous iteration[/dim]\n"
     )
-    console.print()
 
+    watcher = _CompletionWatcher()
     try:
         claude = ClaudeService(working_dir=project_root, verbose=verbose)
-        output_text, exit_code = claude.run_print_mode(
+        _, exit_code = claude.run_print_mode(
             prompt,
             stream=True,
             skip_permissions=True,
             append_system_prompt=ClaudeService.AUTONOMOUS_MODE_PROMPT,
+            on_text=watcher,
         )
 
         if exit_code != 0:
@@ -111,15 +143,15 @@ def once(
 
     console.print()
 
-    all_complete = "<ralph>COMPLETE</ralph>" in output_text
+    all_complete = watcher.found
 
     updated_tasks: TasksFile | None = None
     updated_story: UserStory | None = None
     story_passed = False
 
     try:
-        updated_tasks = load_tasks(tasks_path)
-        updated_story = next((s for s in updated_tasks.user_stories if s.id == next_story.id), None)
+        updated_tasks = load_tasks_cached(tasks_path)
+        updated_story = updated_tasks.stories_by_id.get(next_story.id)
         story_passed = updated_story is not None and updated_story.passes
     except (FileNotFoundError, ValidationError, OSError) as e:
         logger.warning(f"Could not verify story status: {e}")
@@ -141,7 +173,7 @@ def once(
         print_success("All stories are now complete!")
         console.print("[dim]Feature implementation finished.[/dim]")
     elif updated_tasks is not None:
-        remaining = sum(1 for s in updated_tasks.user_stories if not s.passes)
+        _, remaining = _scan_stories(updated_tasks)
         console.print()
         console.print(f"[dim]Stories remaining: {remaining}[/dim]")
 
@@ -152,6 +184,28 @@ def once(
     raise typer.Exit(1)
 
 
+def _scan_stories(tasks: TasksFile) -> tuple[UserStory | None, int]:
+    """Find the next story and count incomplete stories in a single pass.
+
+    Args:
+        tasks: TasksFile model.
+
+    Returns:
+        Tuple of (next_story, incomplete_count). next_story is the
+        highest-priority story with passes=false (the first one on ties),
+        or None if all are complete.
+    """
+    next_story: UserStory | None = None
+    incomplete_count = 0
+    for story in tasks.user_stories:
+        if story.passes:
+            continue
+        incomplete_count += 1
+        if next_story is None or story.priority < next_story.priority:
+            next_story = story
+    return next_story, incomplete_count
+
+
 def _find_next_story(tasks: TasksFile) -> UserStory | None:
     """Find the highest-priority story with passes=false.
 
@@ -161,12 +215,12 @@ def _find_next_story(tasks: TasksFile) -> UserStory | None:
     Returns:
         The next UserStory to work on, or None if all complete.
     """
-    incomplete = [s for s in tasks.user_stories if not s.passes]
-    if not incomplete:
-        return None
-
-    incomplete.sort(key=lambda s: s.priority)
-    return incomplete[0]
+    # min keeps the first of equal priorities, like a stable sort would
+    return min(
+        (s for s in tasks.user_stories if not s.passes),
+        key=lambda s: s.priority,
+        default=None,
+    )
 
 
 def _build_prompt_from_skill(story: UserStory, max_fix_attempts: int) -> str:
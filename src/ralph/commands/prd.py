@@ -15,37 +15,45 @@ from ralph.utils import build_skill_prompt, console, print_error, print_success,
 
 logger = logging.getLogger(__name__)
 
+# Largest feature description file read for --file; anything bigger is rejected
+MAX_FEATURE_FILE_BYTES = 1_048_576
 
-def _get_file_mtime(path: Path) -> float | None:
-    """Get the modification time of a file, or None if it doesn't exist.
+
+def _get_file_signature(path: Path) -> tuple[int, int, int] | None:
+    """Get a change signature for a file, or None if it doesn't exist.
+
+    Combines modification time, size and inode from a single stat so a
+    rewrite is noticed even on filesystems with coarse mtime resolution.
 
     Args:
         path: Path to the file.
 
     Returns:
-        The mtime as a float, or None if the file doesn't exist.
+        Tuple of (st_mtime_ns, st_size, st_ino), or None if the file doesn't exist.
     """
-    if path.exists():
-        return os.path.getmtime(path)
-    return None
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
 
 
 def _check_file_modified(
     output_path: Path,
     output: Path,
-    mtime_before: float | None,
+    signature_before: tuple[int, int, int] | None,
 ) -> None:
     """Check if the output file was created or modified and display appropriate message.
 
     Args:
         output_path: Full path to the output file.
         output: Relative output path for display.
-        mtime_before: The mtime of the file before Claude ran, or None if it didn't exist.
+        signature_before: The file signature before Claude ran, or None if it didn't exist.
     """
-    mtime_after = _get_file_mtime(output_path)
+    signature_after = _get_file_signature(output_path)
 
     # File was created or modified
-    if mtime_after is not None and (mtime_before is None or mtime_after > mtime_before):
+    if signature_after is not None and signature_after != signature_before:
         print_success(f"PRD saved to {output}")
         console.print()
         console.print("[bold]Next steps:[/bold]")
@@ -94,10 +102,13 @@ def prd(
     project_root = Path.cwd()
     output_path = project_root / output
 
-    plans_dir = project_root / "plans"
-    if not plans_dir.exists():
-        print_warning("plans/ directory not found.")
-        console.print("Run [cyan]ralph init[/cyan] first to initialize the project.")
+    # Check the directory the PRD will be written to, not always plans/
+    if not output_path.parent.exists():
+        print_warning(f"{output.parent}/ directory not found.")
+        if output.parent == Path("plans"):
+            console.print("Run [cyan]ralph init[/cyan] first to initialize the project.")
+        else:
+            console.print("Create the directory or choose a different --output path.")
         raise typer.Exit(1)
 
     # Check for mutual exclusivity of --input and --file
@@ -117,7 +128,12 @@ def prd(
         if not file_path.exists():
             print_error(f"File not found: {file}")
             raise typer.Exit(1)
-        feature_description = file_path.read_text().strip()
+        with file_path.open("rb") as f:
+            raw = f.read(MAX_FEATURE_FILE_BYTES)
+            if f.read(1):
+                print_error(f"File too large: {file} (limit {MAX_FEATURE_FILE_BYTES} bytes)")
+                raise typer.Exit(1)
+        feature_description = raw.decode("utf-8", errors="replace").strip()
         if not feature_description:
             print_error(f"File is empty: {file}")
             raise typer.Exit(1)
@@ -130,21 +146,22 @@ def prd(
         return
 
     # Interactive mode (default)
-    console.print("[bold]Interactive PRD Creation[/bold]")
-    console.print()
-    console.print("Claude will guide you through creating a Product Requirements Document (PRD).")
-    console.print()
-    console.print("[dim]Tips for a good PRD session:[/dim]")
-    console.print("  - Describe the feature you want to build")
-    console.print("  - Answer Claude's clarifying questions")
-    console.print("  - Review and refine the generated PRD")
-    console.print()
-    console.print(f"[dim]Output will be saved to:[/dim] [cyan]{output}[/cyan]")
-    console.print()
-    console.print("[bold]Starting Claude Code...[/bold]")
-    console.print()
-    console.print("[dim]Running with auto-approved permissions for PRD creation[/dim]")
-    console.print()
+    console.print(
+        "[bold]Interactive PRD Creation[/bold]\n"
+        "\n"
+        "Claude will guide you through creating a Product Requirements Document (PRD).\n"
+        "\n"
+        "[dim]Tips for a good PRD session:[/dim]\n"
+        "  - Describe the feature you want to build\n"
+        "  - Answer Claude's clarifying questions\n"
+        "  - Review and refine the generated PRD\n"
+        "\n"
+        f"[dim]Output will be saved to:[/dim] [cyan]{output}[/cyan]\n"
+        "\n"
+        "[bold]Starting Claude Code...[/bold]\n"
+        "\n"
+        "[dim]Running with auto-approved permissions for PRD creation[/dim]\n"
+    )
 
     try:
         prompt = _build_prompt_from_skill(output_path)
@@ -152,8 +169,8 @@ def prd(
         print_error(f"Skill not found: {e}")
         raise typer.Exit(1) from e
 
-    # Record mtime before Claude runs
-    mtime_before = _get_file_mtime(output_path)
+    # Record the file signature before Claude runs
+    signature_before = _get_file_signature(output_path)
 
     try:
         claude = ClaudeService(working_dir=project_root, verbose=verbose)
@@ -165,7 +182,7 @@ def prd(
 
         if exit_code == 0:
             console.print()
-            _check_file_modified(output_path, output, mtime_before)
+            _check_file_modified(output_path, output, signature_before)
         else:
             print_warning("Claude Code exited with non-zero status.")
             raise typer.Exit(exit_code)
@@ -194,13 +211,14 @@ def _run_non_interactive(
     Raises:
         typer.Exit: On error or non-zero exit code from Claude.
     """
-    console.print("[bold]Non-Interactive PRD Generation[/bold]")
-    console.print()
-    console.print(f"[dim]Generating PRD for:[/dim] {feature_description}")
-    console.print(f"[dim]Output will be saved to:[/dim] [cyan]{output}[/cyan]")
-    console.print()
-    console.print("[bold]Running Claude Code...[/bold]")
-    console.print()
+    console.print(
+        "[bold]Non-Interactive PRD Generation[/bold]\n"
+        "\n"
+        f"[dim]Generating PRD for:[/dim] {feature_description}\n"
+        f"[dim]Output will be saved to:[/dim] [cyan]{output}[/cyan]\n"
+        "\n"
+        "[bold]Running Claude Code...[/bold]\n"
+    )
 
     # Load skill content and build prompt with feature description
     try:
@@ -209,20 +227,22 @@ def _run_non_interactive(
         print_error(f"Skill not found: {e}")
         raise typer.Exit(1) from e
 
-    # Record mtime before Claude runs
-    mtime_before = _get_file_mtime(output_path)
+    # Record the file signature before Claude runs
+    signature_before = _get_file_signature(output_path)
 
     try:
         claude = ClaudeService(working_dir=project_root, verbose=verbose)
+        # Output is streamed to the terminal; discard it rather than keep a transcript
         _, exit_code = claude.run_print_mode(
             prompt,
             skip_permissions=True,
             append_system_prompt=ClaudeService.AUTONOMOUS_MODE_PROMPT,
+            on_text=lambda _: None,
         )
 
         if exit_code == 0:
             console.print()
-            _check_file_modified(output_path, output, mtime_before)
+            _check_file_modified(output_path, output, signature_before)
         else:
             print_warning("Claude Code exited with non-zero status.")
             raise typer.Exit(exit_code)
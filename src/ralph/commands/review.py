@@ -10,7 +10,12 @@ from pathlib import Path
 
 import typer
 
-from ralph.models import REVIEW_STATE_FILENAME, ReviewState, load_reviewer_configs
+from ralph.models import (
+    REVIEW_STATE_FILENAME,
+    ReviewerConfig,
+    ReviewState,
+    load_reviewer_configs,
+)
 from ralph.models.finding import Verdict
 from ralph.services import (
     ReviewerResult,
@@ -25,6 +30,7 @@ from ralph.utils import (
     print_error,
     print_review_step,
     print_success,
+    print_warning,
 )
 
 logger = logging.getLogger(__name__)
@@ -109,13 +115,13 @@ def review(
         removed_names = sorted(old_names - new_names)
 
         if added_names or removed_names:
-            console.print("[bold]Configuration Changes:[/bold]")
-            for name in added_names:
-                reason = _get_detection_reason(name)
-                console.print(f"  [green]+ {name}[/green] ({reason})")
-            for name in removed_names:
-                console.print(f"  [red]- {name}[/red]")
-            console.print()
+            change_lines = ["[bold]Configuration Changes:[/bold]"]
+            change_lines.extend(
+                f"  [green]+ {name}[/green] ({_get_detection_reason(name)})" for name in added_names
+            )
+            change_lines.extend(f"  [red]- {name}[/red]" for name in removed_names)
+            change_lines.append("")
+            console.print("\n".join(change_lines))
         else:
             console.print("[dim]No changes detected - configuration is up to date[/dim]")
             console.print()
@@ -129,12 +135,13 @@ def review(
 
         reviewers = detect_reviewers(project_root)
 
-        console.print("[bold]Detected Reviewers:[/bold]")
-        for reviewer in reviewers:
-            reason = _get_detection_reason(reviewer.name)
-            console.print(f"  [green]+[/green] {reviewer.name} ({reason})")
-
-        console.print()
+        detected_lines = ["[bold]Detected Reviewers:[/bold]"]
+        detected_lines.extend(
+            f"  [green]+[/green] {reviewer.name} ({_get_detection_reason(reviewer.name)})"
+            for reviewer in reviewers
+        )
+        detected_lines.append("")
+        console.print("\n".join(detected_lines))
 
         write_reviewer_config(claude_md_path, reviewers)
         console.print(f"[dim]Configuration written to {claude_md_path}[/dim]")
@@ -151,17 +158,28 @@ def review(
         missing_names = suggested_names - current_names
 
         if missing_names:
-            sorted_missing = sorted(missing_names)
-            console.print("[yellow]Suggested reviewers not in current config:[/yellow]")
-            for name in sorted_missing:
-                reason = _get_detection_reason(name)
-                console.print(f"  [yellow]![/yellow] {name} ({reason})")
-            console.print()
-            console.print("[dim]Run 'ralph review --force' to update configuration[/dim]")
-            console.print()
+            suggestion_lines = ["[yellow]Suggested reviewers not in current config:[/yellow]"]
+            suggestion_lines.extend(
+                f"  [yellow]![/yellow] {name} ({_get_detection_reason(name)})"
+                for name in sorted(missing_names)
+            )
+            suggestion_lines.extend(
+                ["", "[dim]Run 'ralph review --force' to update configuration[/dim]", ""]
+            )
+            console.print("\n".join(suggestion_lines))
 
     console.print(f"[dim]Loaded {len(reviewers)} reviewer(s)[/dim]")
 
+    state_path = project_root / REVIEW_STATE_FILENAME
+
+    # Nothing to run, so skip language detection and the review service
+    if not reviewers:
+        if state_path.exists():
+            state_path.unlink()
+        console.print()
+        print_warning("No reviewers configured - nothing to review")
+        raise typer.Exit(0)
+
     detected_languages = detect_languages(project_root)
     if detected_languages:
         lang_names = ", ".join(lang.value for lang in detected_languages)
@@ -180,7 +198,6 @@ def review(
     )
 
     # Load resume state if requested
-    state_path = project_root / REVIEW_STATE_FILENAME
     state: ReviewState | None = None
     if resume_review:
         config_hash = ReviewState.compute_config_hash(reviewers)
@@ -201,6 +218,7 @@ def review(
 
     results: list[ReviewerResult] = []
     total_reviewers = len(reviewers)
+    pending_skipped: list[ReviewerConfig] = []
 
     for i, reviewer in enumerate(reviewers, start=1):
         if not review_service.should_run_reviewer(reviewer, detected_languages):
@@ -214,7 +232,7 @@ def review(
                 attempts=0,
             )
             results.append(result)
-            review_service._append_review_summary(progress_path, reviewer, result)
+            pending_skipped.append(reviewer)
             continue
 
         # Skip already-completed reviewers when resuming
@@ -230,6 +248,9 @@ def review(
             results.append(result)
             continue
 
+        review_service._append_skipped_summaries(progress_path, pending_skipped)
+        pending_skipped.clear()
+
         print_review_step(i, total_reviewers, reviewer.name)
         console.print()
 
@@ -282,9 +303,9 @@ def review(
 
         console.print()
 
-    console.print()
-    console.print("[bold]Review Summary[/bold]")
-    console.print()
+    review_service._append_skipped_summaries(progress_path, pending_skipped)
+
+    summary_lines = ["", "[bold]Review Summary[/bold]", ""]
 
     passed = 0
     failed = 0
@@ -294,28 +315,31 @@ def review(
     for result in results:
         if result.skipped:
             skipped += 1
-            console.print(f"  [dim]- {result.reviewer_name}: skipped (language filter)[/dim]")
+            summary_lines.append(
+                f"  [dim]- {result.reviewer_name}: skipped (language filter)[/dim]"
+            )
         elif result.fix_skipped:
             skipped_fix += 1
-            console.print(
+            summary_lines.append(
                 f"  [yellow][FINDINGS][/yellow] {result.reviewer_name}: findings (not fixed)"
             )
         elif result.success:
             passed += 1
-            console.print(f"  [green][OK][/green] {result.reviewer_name}: passed")
+            summary_lines.append(f"  [green][OK][/green] {result.reviewer_name}: passed")
         else:
             failed += 1
             error_info = f" ({result.error})" if result.error else ""
             attempts_text = f"failed after {result.attempts} attempt(s)"
-            console.print(
+            summary_lines.append(
                 f"  [red][FAIL][/red] {result.reviewer_name}: {attempts_text}{error_info}"
             )
 
-    console.print()
     summary_parts = [f"Passed: {passed}", f"Failed: {failed}", f"Skipped: {skipped}"]
     if skipped_fix > 0:
         summary_parts.append(f"Findings (not fixed): {skipped_fix}")
-    console.print(f"[dim]{', '.join(summary_parts)}[/dim]")
+    summary_lines.append("")
+    summary_lines.append(f"[dim]{', '.join(summary_parts)}[/dim]")
+    console.print("\n".join(summary_lines))
 
     # Clean up state file on successful completion
     if state_path.exists():
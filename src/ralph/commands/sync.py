@@ -51,12 +51,15 @@ def sync(
 
     if skills_dir is not None and not skills_dir.exists():
         print_warning(f"Skills directory not found: {skills_dir}")
-        console.print("\nTo create skills, add a skills/ directory with subdirectories")
-        console.print("containing SKILL.md files with frontmatter:\n")
-        console.print("  ---")
-        console.print('  name: "my-skill"')
-        console.print('  description: "What this skill does"')
-        console.print("  ---")
+        console.print(
+            "\nTo create skills, add a skills/ directory with subdirectories\n"
+            "containing SKILL.md files with frontmatter:\n"
+            "\n"
+            "  ---\n"
+            '  name: "my-skill"\n'
+            '  description: "What this skill does"\n'
+            "  ---"
+        )
         raise typer.Exit(0)
 
     if skills_dir is None:
@@ -78,25 +81,28 @@ def sync(
     invalid_count = 0
     error_count = 0
 
+    result_lines: list[str] = []
+
     for result in results:
         if result.status == SyncStatus.CREATED:
-            console.print(f"  [green][OK][/green] {result.skill_name} [dim](created)[/dim]")
+            result_lines.append(f"  [green][OK][/green] {result.skill_name} [dim](created)[/dim]")
             created_count += 1
         elif result.status == SyncStatus.UPDATED:
-            console.print(f"  [green][OK][/green] {result.skill_name} [dim](updated)[/dim]")
+            result_lines.append(f"  [green][OK][/green] {result.skill_name} [dim](updated)[/dim]")
             updated_count += 1
         elif result.status == SyncStatus.INVALID:
-            console.print(f"  [yellow]![/yellow] {result.skill_name} [dim](invalid)[/dim]")
+            result_lines.append(f"  [yellow]![/yellow] {result.skill_name} [dim](invalid)[/dim]")
             if result.error:
-                console.print(f"      [dim]{result.error}[/dim]")
+                result_lines.append(f"      [dim]{result.error}[/dim]")
             invalid_count += 1
         elif result.status == SyncStatus.SKIPPED:
-            console.print(f"  [red][FAIL][/red] {result.skill_name} [dim](error)[/dim]")
+            result_lines.append(f"  [red][FAIL][/red] {result.skill_name} [dim](error)[/dim]")
             if result.error:
-                console.print(f"      [dim]{result.error}[/dim]")
+                result_lines.append(f"      [dim]{result.error}[/dim]")
             error_count += 1
 
-    console.print()
+    result_lines.append("")
+    console.print("\n".join(result_lines))
 
     total_synced = created_count + updated_count
     if total_synced > 0:
@@ -130,8 +136,7 @@ def _handle_remove(service: SkillsService) -> None:
         print_warning("No ralph skills to remove (no manifest found or already removed)")
         return
 
-    for skill_name in removed:
-        console.print(f"  [green][OK][/green] {skill_name} [dim](removed)[/dim]")
-
-    console.print()
+    removed_lines = [f"  [green][OK][/green] {name} [dim](removed)[/dim]" for name in removed]
+    removed_lines.append("")
+    console.print("\n".join(removed_lines))
     print_success(f"Removed {len(removed)} skill(s)")
@@ -22,7 +22,7 @@ from ralph.models.reviewer import (
     load_reviewer_configs,
     parse_reviewer_configs,
 )
-from ralph.models.tasks import TasksFile, UserStory, load_tasks, save_tasks
+from ralph.models.tasks import TasksFile, UserStory, load_tasks, load_tasks_cached, save_tasks
 
 __all__ = [
     "Finding",
@@ -43,6 +43,7 @@ __all__ = [
     "load_quality_checks",
     "load_reviewer_configs",
     "load_tasks",
+    "load_tasks_cached",
     "parse_quality_checks",
     "parse_review_output",
     "parse_reviewer_configs",
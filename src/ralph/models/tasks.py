@@ -5,6 +5,7 @@ in the Ralph workflow to track user stories and their completion status.
 """
 
 import logging
+from functools import cached_property
 from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -67,6 +68,18 @@ class TasksFile(BaseModel):
         default_factory=list, alias="userStories", description="List of user stories"
     )
 
+    @cached_property
+    def stories_by_id(self) -> dict[str, UserStory]:
+        """Index of user stories by ID.
+
+        Built on first access and not updated if user_stories is later
+        modified in place. If an ID repeats, the first story wins.
+
+        Returns:
+            Mapping of story ID to UserStory.
+        """
+        return {story.id: story for story in reversed(self.user_stories)}
+
 
 def load_tasks(path: Path) -> TasksFile:
     """Load and validate a TASKS.json file.
@@ -85,6 +98,38 @@ def load_tasks(path: Path) -> TasksFile:
     return TasksFile.model_validate_json(content)
 
 
+# Parsed TASKS.json per path, keyed by the (st_mtime_ns, st_size) it was read at
+_tasks_cache: dict[Path, tuple[tuple[int, int], TasksFile]] = {}
+
+
+def load_tasks_cached(path: Path) -> TasksFile:
+    """Load a TASKS.json file, reusing the last parse while it is unchanged.
+
+    The file is stat'ed on every call and only re-parsed when its
+    modification time or size differs from the cached parse. Callers
+    share the returned model and must not modify it.
+
+    Args:
+        path: Path to the TASKS.json file
+
+    Returns:
+        Validated TasksFile model
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        pydantic.ValidationError: If the file content is invalid
+    """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _tasks_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    tasks = load_tasks(path)
+    _tasks_cache[path] = (key, tasks)
+    return tasks
+
+
 def save_tasks(tasks: TasksFile, path: Path) -> None:
     """Save a TasksFile model to a JSON file.
 
@@ -2,7 +2,7 @@
 
 from ralph.services.claude import ClaudeError, ClaudeService
 from ralph.services.fix_loop import FixLoopService, FixResult
-from ralph.services.git import GitError, GitService
+from ralph.services.git import GitError, GitService, find_git_dir
 from ralph.services.language import Language, LanguageDetector, detect_languages
 from ralph.services.review_loop import (
     ReviewerResult,
@@ -48,6 +48,7 @@ __all__ = [
     "detect_languages",
     "detect_reviewers",
     "filter_reviewers_by_language",
+    "find_git_dir",
     "has_reviewer_config",
     "write_reviewer_config",
 ]
@@ -9,10 +9,11 @@ import logging
 import shutil
 import subprocess
 import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import ClassVar, TextIO
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,9 @@ without asking for confirmation or permission."""
     stdout: TextIO = Field(default_factory=lambda: sys.stdout)
     stderr: TextIO = Field(default_factory=lambda: sys.stderr)
 
+    # Resolved CLI path, looked up on first use and reused for later runs
+    _claude_path: str | None = PrivateAttr(default=None)
+
     def _parse_stream_event(self, line: str) -> str | None:
         """Parse a stream-json line and return displayable text.
 
@@ -104,30 +108,35 @@ without asking for confirmation or permission."""
         self,
         process: subprocess.Popen[str],
         parse_json: bool = False,
+        on_text: Callable[[str], None] | None = None,
     ) -> tuple[str, str]:
         """Stream process output to terminal in real-time.
 
         Args:
             process: Running subprocess to stream from.
             parse_json: If True, parse stream-json events and display text content.
+            on_text: Optional callback receiving each displayed chunk. When
+                given, chunks are handed to it instead of being collected.
 
         Returns:
             Tuple of (stdout_content, stderr_content).
             When parse_json is True, stdout_content is the extracted text.
+            When on_text is given, stdout_content is empty.
         """
         collected_text: list[str] = []
         stderr_lines: list[str] = []
+        collect = collected_text.append if on_text is None else on_text
 
         if process.stdout:
             for line in process.stdout:
                 if parse_json:
                     text = self._parse_stream_event(line.strip())
                     if text:
-                        collected_text.append(text)
+                        collect(text)
                         self.stdout.write(text)
                         self.stdout.flush()
                 else:
-                    collected_text.append(line)
+                    collect(line)
                     self.stdout.write(line)
                     self.stdout.flush()
 
@@ -149,18 +158,21 @@ without asking for confirmation or permission."""
 
         Returns:
             List of base arguments including the Claude CLI path and
-            common flags.
+            common flags. The CLI path is looked up in PATH once per
+            service instance.
 
         Raises:
             ClaudeError: If Claude Code CLI is not found in PATH.
         """
-        claude_path = shutil.which(self.claude_command)
-        if claude_path is None:
-            msg = "Claude Code CLI not found. "
-            msg += f"Ensure '{self.claude_command}' is installed and in PATH."
-            raise ClaudeError(msg)
+        if self._claude_path is None:
+            claude_path = shutil.which(self.claude_command)
+            if claude_path is None:
+                msg = "Claude Code CLI not found. "
+                msg += f"Ensure '{self.claude_command}' is installed and in PATH."
+                raise ClaudeError(msg)
+            self._claude_path = claude_path
 
-        args = [claude_path]
+        args = [self._claude_path]
 
         if self.verbose:
             args.append("--verbose")
@@ -171,7 +183,11 @@ without asking for confirmation or permission."""
         return args
 
     def _run_process(
-        self, args: list[str], stream: bool, parse_json: bool = False
+        self,
+        args: list[str],
+        stream: bool,
+        parse_json: bool = False,
+        on_text: Callable[[str], None] | None = None,
     ) -> tuple[str, int]:
         """Run a Claude CLI process and capture output.
 
@@ -179,6 +195,8 @@ without asking for confirmation or permission."""
             args: Command arguments to run.
             stream: Whether to stream output to terminal.
             parse_json: If True and streaming, parse stream-json events.
+            on_text: Optional callback receiving streamed text chunks instead
+                of them being collected. Ignored when not streaming.
 
         Returns:
             Tuple of (output_text, exit_code).
@@ -198,7 +216,9 @@ without asking for confirmation or permission."""
             )
 
             if stream:
-                stdout_content, _ = self._stream_output(process, parse_json=parse_json)
+                stdout_content, _ = self._stream_output(
+                    process, parse_json=parse_json, on_text=on_text
+                )
             else:
                 stdout_content, stderr_content = process.communicate()
                 if stderr_content:
@@ -273,6 +293,7 @@ without asking for confirmation or permission."""
         allowed_tools: list[str] | None = None,
         skip_permissions: bool = False,
         append_system_prompt: str | None = None,
+        on_text: Callable[[str], None] | None = None,
     ) -> tuple[str, int]:
         """Run Claude Code in print mode (-p flag).
 
@@ -288,6 +309,8 @@ without asking for confirmation or permission."""
             allowed_tools: Optional list of allowed tools.
             skip_permissions: Whether to skip permission prompts (default: False).
             append_system_prompt: Optional text to append to system prompt.
+            on_text: Optional callback receiving each streamed text chunk. When
+                given, the transcript is not accumulated and output_text is empty.
 
         Returns:
             Tuple of (output_text, exit_code).
@@ -323,7 +346,7 @@ without asking for confirmation or permission."""
         if stream:
             args.extend(["--output-format", "stream-json"])
 
-        return self._run_process(args, stream, parse_json=stream)
+        return self._run_process(args, stream, parse_json=stream, on_text=on_text)
 
     def run_with_output_format(
         self,
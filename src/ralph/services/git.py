@@ -5,6 +5,8 @@ management, commits, and repository inspection using subprocess.
 """
 
 import logging
+import os
+import stat
 import subprocess
 from pathlib import Path
 
@@ -74,6 +76,21 @@ class GitService(BaseModel):
         result = self._run(["branch", "--show-current"])
         return result.stdout.strip()
 
+    def get_git_dir(self) -> Path:
+        """Get the absolute path of the repository's git directory.
+
+        Resolves worktrees, submodules and GIT_DIR the same way git does,
+        and works from any subdirectory of the repository.
+
+        Returns:
+            Absolute path to the git directory.
+
+        Raises:
+            GitError: If not in a git repository or command fails.
+        """
+        result = self._run(["rev-parse", "--absolute-git-dir"])
+        return Path(result.stdout.strip())
+
     def get_default_branch(self) -> str:
         """Detect the default branch (main or master).
 
@@ -175,3 +192,60 @@ class GitService(BaseModel):
         """
         if files:
             self._run(["add", *files])
+
+
+def find_git_dir(start: Path) -> Path | None:
+    """Find the git directory of the repository containing a path.
+
+    Walks up from ``start`` looking for a ``.git`` directory, or a ``.git``
+    file holding a ``gitdir:`` pointer (as used by worktrees and submodules),
+    without starting a git process. GIT_DIR is not consulted; use
+    GitService.get_git_dir when it may be set.
+
+    Args:
+        start: Directory to start searching from.
+
+    Returns:
+        Path to the git directory, or None if no repository was found.
+    """
+    current = start.resolve()
+    while True:
+        dot_git = current / ".git"
+        try:
+            st = os.stat(dot_git)
+        except OSError:
+            pass
+        else:
+            if stat.S_ISDIR(st.st_mode):
+                return dot_git
+            if stat.S_ISREG(st.st_mode):
+                git_dir = _read_gitdir_pointer(dot_git)
+                if git_dir is not None:
+                    return git_dir
+        if current.parent == current:
+            return None
+        current = current.parent
+
+
+def _read_gitdir_pointer(dot_git: Path) -> Path | None:
+    """Read the git directory a ``.git`` file points at.
+
+    Args:
+        dot_git: Path to the ``.git`` file.
+
+    Returns:
+        The pointed-to directory, resolved against the file's directory when
+        relative, or None if the file is not a gitdir pointer.
+    """
+    try:
+        with open(dot_git, encoding="utf-8") as f:
+            line = f.readline()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    if not line.startswith("gitdir:"):
+        return None
+    target = line[len("gitdir:") :].strip()
+    if not target:
+        return None
+    return dot_git.parent / target
@@ -58,13 +58,12 @@ class LanguageDetector(BaseModel):
         detected: set[Language] = set()
 
         for marker_file, languages in _LANGUAGE_MARKERS.items():
-            marker_path = self.project_root / marker_file
-            if marker_path.exists():
+            if (self.project_root / marker_file).exists():
                 detected.update(languages)
 
+        # The first match is enough, so stop walking the tree there
         for pattern, languages in _LANGUAGE_PATTERNS.items():
-            matches = list(self.project_root.glob(pattern))
-            if matches:
+            if next(self.project_root.glob(pattern), None) is not None:
                 detected.update(languages)
 
         return detected
@@ -5,7 +5,7 @@ in order as part of the Ralph post-story review loop.
 """
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import NamedTuple
@@ -81,8 +81,8 @@ class ReviewLoopService(BaseModel):
         if not reviewer.languages:
             return True
 
-        detected_language_values = {lang.value for lang in detected_languages}
-        return any(lang in detected_language_values for lang in reviewer.languages)
+        # Language is a str enum, so its members compare equal to their values
+        return not detected_languages.isdisjoint(reviewer.languages)
 
     def is_enforced(self, reviewer: ReviewerConfig, strict: bool) -> bool:
         """Determine if a reviewer's failures should be enforced.
@@ -256,6 +256,7 @@ class ReviewLoopService(BaseModel):
             List of ReviewerResult objects for each reviewer.
         """
         results: list[ReviewerResult] = []
+        pending_skipped: list[ReviewerConfig] = []
 
         for reviewer in reviewers:
             was_language_filtered = not self.should_run_reviewer(reviewer, detected_languages)
@@ -271,12 +272,13 @@ class ReviewLoopService(BaseModel):
                     attempts=0,
                 )
                 results.append(result)
-
-                if progress_path:
-                    self._append_review_summary(progress_path, reviewer, result)
-
+                pending_skipped.append(reviewer)
                 continue
 
+            if progress_path:
+                self._append_skipped_summaries(progress_path, pending_skipped)
+            pending_skipped.clear()
+
             enforced = self.is_enforced(reviewer, strict)
 
             result = self.run_reviewer(reviewer, enforced=enforced)
@@ -330,6 +332,9 @@ class ReviewLoopService(BaseModel):
             else:
                 logger.warning(f"Reviewer {reviewer.name} failed after {result.attempts} attempts")
 
+        if progress_path:
+            self._append_skipped_summaries(progress_path, pending_skipped)
+
         return results
 
     def _build_reviewer_prompt(self, reviewer: ReviewerConfig, skill_content: str) -> str:
@@ -379,14 +384,7 @@ Begin the review now."""
 
         # For skipped reviewers, use simple format
         if result.skipped:
-            status = "skipped (language filter)"
-            level_val = reviewer.level.value
-            note = f"\n[Review Loop] {timestamp} - {reviewer.name} ({level_val}): {status}\n"
-            try:
-                with open(progress_path, "a", encoding="utf-8") as f:
-                    f.write(note)
-            except OSError as e:
-                logger.warning(f"Could not append review summary: {e}")
+            self._append_skipped_summaries(progress_path, [reviewer])
             return
 
         # Build structured format when review_output is available
@@ -433,6 +431,35 @@ Begin the review now."""
         except OSError as e:
             logger.warning(f"Could not append review summary: {e}")
 
+    def _append_skipped_summaries(
+        self,
+        progress_path: Path,
+        reviewers: Sequence[ReviewerConfig],
+    ) -> None:
+        """Append skip summaries for language-filtered reviewers to PROGRESS.txt.
+
+        Callers collect skipped reviewers and call this before the next
+        reviewer runs, so a run of skips is written with a single append.
+
+        Args:
+            progress_path: Path to PROGRESS.txt.
+            reviewers: The skipped reviewer configurations, in order.
+        """
+        if not reviewers:
+            return
+
+        timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M UTC")
+        note = "".join(
+            f"\n[Review Loop] {timestamp} - {reviewer.name} ({reviewer.level.value}): "
+            "skipped (language filter)\n"
+            for reviewer in reviewers
+        )
+        try:
+            with open(progress_path, "a", encoding="utf-8") as f:
+                f.write(note)
+        except OSError as e:
+            logger.warning(f"Could not append review summary: {e}")
+
 
 def filter_reviewers_by_language(
     reviewers: list[ReviewerConfig],
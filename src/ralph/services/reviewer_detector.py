@@ -4,12 +4,31 @@ This module provides functionality to analyze a project and determine
 which code reviewers should be configured based on project contents.
 """
 
+import os
 from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict
 
 from ralph.models.reviewer import ReviewerConfig, ReviewerLevel
 
+# Dependency, cache and build directories that never hold project sources
+_EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "__pycache__",
+        "node_modules",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        "dist",
+        "build",
+        ".eggs",
+    }
+)
+
 
 class ReviewerDetector(BaseModel):
     """Service for detecting which reviewers should be configured for a project.
@@ -53,7 +72,9 @@ class ReviewerDetector(BaseModel):
             )
         )
 
-        if self._has_python_files():
+        has_python, has_bicep, has_tests = self._scan_source_files()
+
+        if has_python:
             reviewers.append(
                 ReviewerConfig(
                     name="python-code",
@@ -63,7 +84,7 @@ class ReviewerDetector(BaseModel):
                 )
             )
 
-        if self._has_bicep_files():
+        if has_bicep:
             reviewers.append(
                 ReviewerConfig(
                     name="bicep",
@@ -82,7 +103,7 @@ class ReviewerDetector(BaseModel):
                 )
             )
 
-        if self._has_test_files():
+        if has_tests:
             reviewers.append(
                 ReviewerConfig(
                     name="test-quality",
@@ -102,29 +123,54 @@ class ReviewerDetector(BaseModel):
 
         return reviewers
 
-    def _has_python_files(self) -> bool:
-        """Check if the project contains Python files."""
-        matches = list(self.project_root.glob("**/*.py"))
-        return len(matches) > 0
+    def _scan_source_files(self) -> tuple[bool, bool, bool]:
+        """Walk the project once looking for Python, Bicep and test files.
+
+        Skips dependency, cache and build directories and does not follow
+        directory symlinks. Returns as soon as all three kinds are found,
+        even part-way through a directory; otherwise the whole tree is
+        walked to confirm what is absent.
 
-    def _has_bicep_files(self) -> bool:
-        """Check if the project contains Bicep files."""
-        matches = list(self.project_root.glob("**/*.bicep"))
-        return len(matches) > 0
+        Returns:
+            Tuple of (has_python, has_bicep, has_tests).
+        """
+        has_python = has_bicep = has_tests = False
+        pending = [os.fspath(self.project_root)]
+
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in _EXCLUDED_DIRS and not name.endswith(".egg-info"):
+                        pending.append(entry.path)
+                elif name.endswith(".py"):
+                    has_python = True
+                    if name.startswith("test_") or name.endswith("_test.py"):
+                        has_tests = True
+                elif name.endswith(".bicep"):
+                    has_bicep = True
+                else:
+                    continue
+
+                if has_python and has_bicep and has_tests:
+                    return True, True, True
+
+        return has_python, has_bicep, has_tests
 
     def _has_github_actions(self) -> bool:
         """Check if the project has GitHub Actions workflows."""
         workflows_dir = self.project_root / ".github" / "workflows"
         if not workflows_dir.exists():
             return False
-        matches = list(workflows_dir.glob("*.yml")) + list(workflows_dir.glob("*.yaml"))
-        return len(matches) > 0
-
-    def _has_test_files(self) -> bool:
-        """Check if the project contains test files (test_*.py or *_test.py)."""
-        test_prefix_matches = list(self.project_root.glob("**/test_*.py"))
-        test_suffix_matches = list(self.project_root.glob("**/*_test.py"))
-        return len(test_prefix_matches) > 0 or len(test_suffix_matches) > 0
+        return any(
+            next(workflows_dir.glob(pattern), None) is not None for pattern in ("*.yml", "*.yaml")
+        )
 
     def _has_changelog(self) -> bool:
         """Check if the project has a CHANGELOG.md file."""
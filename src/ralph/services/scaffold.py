@@ -218,11 +218,14 @@ class ScaffoldService(BaseModel):
         write_file(progress_path, PROGRESS_TEMPLATE)
         return progress_path
 
-    def create_claude_md(self, project_name: str | None = None) -> Path:
+    def create_claude_md(
+        self, project_name: str | None = None, project_type: ProjectType | None = None
+    ) -> Path:
         """Create a CLAUDE.md file with quality checks template.
 
         Args:
             project_name: Optional project name (defaults to directory name).
+            project_type: Optional already-detected project type (detected if omitted).
 
         Returns:
             Path to the created CLAUDE.md file.
@@ -230,7 +233,8 @@ class ScaffoldService(BaseModel):
         if project_name is None:
             project_name = self.project_root.name
 
-        project_type = self.detect_project_type()
+        if project_type is None:
+            project_type = self.detect_project_type()
         checks_yaml = self._get_quality_checks_yaml(project_type)
 
         claude_md_path = self.project_root / "CLAUDE.md"
@@ -408,13 +412,17 @@ This project uses the Ralph autonomous iteration pattern.
         return gitignore_path
 
     def scaffold_all(
-        self, project_name: str | None = None, skip_changelog: bool = False
+        self,
+        project_name: str | None = None,
+        skip_changelog: bool = False,
+        project_type: ProjectType | None = None,
     ) -> dict[str, Path]:
         """Create all Ralph workflow files.
 
         Args:
             project_name: Optional project name (defaults to directory name).
             skip_changelog: If True, skip creating CHANGELOG.md (e.g., if it already exists).
+            project_type: Optional already-detected project type (detected if omitted).
 
         Returns:
             Dictionary mapping file type to created path.
@@ -426,7 +434,7 @@ This project uses the Ralph autonomous iteration pattern.
             "spec": self.create_spec_placeholder(),
             "tasks": self.create_tasks_placeholder(),
             "progress": self.create_progress_placeholder(),
-            "claude_md": self.create_claude_md(project_name),
+            "claude_md": self.create_claude_md(project_name, project_type),
             "agents_md": self.create_agents_md(project_name),
             "gitignore": self.create_gitignore(),
         }
@@ -10,6 +10,7 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 
 from rich.console import Console
+from rich.highlighter import NullHighlighter
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +23,15 @@ def create_console() -> Console:
 
     On Windows terminals with legacy encodings (cp1252, cp437, ascii), enables
     legacy_windows mode to avoid unicode encoding errors. On UTF-8 terminals
-    and non-Windows platforms, uses default Console settings.
+    and non-Windows platforms, uses default Console settings. When Rich does
+    not treat stdout as a terminal, automatic highlighting is disabled since
+    its styles would be stripped anyway.
 
     Returns:
         Console: A configured Rich Console instance.
     """
+    legacy_windows = False
+
     # Only apply legacy mode on Windows with non-UTF-8 encodings
     if sys.platform == "win32":
         # Get stdout encoding, defaulting to utf-8 if not available
@@ -38,9 +43,14 @@ def create_console() -> Console:
                 "Detected legacy Windows encoding '%s', enabling legacy_windows mode",
                 encoding,
             )
-            return Console(legacy_windows=True)
+            legacy_windows = True
+
+    # Leave legacy_windows unset otherwise so Rich keeps its own detection
+    console = Console(legacy_windows=True) if legacy_windows else Console()
 
-    return Console()
+    if not console.is_terminal:
+        console.highlighter = NullHighlighter()
+    return console
 
 
 console = create_console()
@@ -11,6 +11,8 @@ Focused integration tests for happy path of each command:
 
 import json
 import os
+import subprocess
+import sys
 from collections.abc import Iterator
 from contextlib import contextmanager
 from io import StringIO
@@ -23,6 +25,7 @@ from typer.testing import CliRunner
 
 from ralph import __version__
 from ralph.cli import app
+from ralph.services import GitError, GitService
 
 
 @contextmanager
@@ -112,6 +115,14 @@ def project_with_tasks(tmp_path: Path) -> Path:
     return tmp_path
 
 
+def _feature_branch_git() -> MagicMock:
+    """Build a GitService stand-in that stays on the test feature branch."""
+    git = MagicMock()
+    git.get_git_dir.side_effect = GitError("not a git repository")
+    git.get_current_branch.return_value = "ralph/test-feature"
+    return git
+
+
 @pytest.fixture
 def skills_dir(python_project: Path) -> Path:
     """Create a skills directory with a valid skill."""
@@ -127,6 +138,38 @@ def skills_dir(python_project: Path) -> Path:
     return skills_path
 
 
+def _run_cli_in_subprocess(
+    args: list[str], env: dict[str, str] | None = None
+) -> tuple[str, list[str]]:
+    """Run the CLI in a fresh interpreter and report which command modules it imported.
+
+    Args:
+        args: Command-line arguments to pass to the app.
+        env: Extra environment variables for the interpreter.
+
+    Returns:
+        Tuple of (CLI output, sorted names of imported ralph.commands modules).
+    """
+    script = (
+        "import json, sys\n"
+        "from ralph.cli import app\n"
+        "try:\n"
+        f"    app({args!r}, prog_name='ralph')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith('ralph.commands.'))))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **(env or {})},
+    )
+    output, _, imported = result.stdout.rstrip().rpartition("\n")
+    return output, json.loads(imported)
+
+
 class TestCliHelp:
     """Tests for CLI help and version."""
 
@@ -145,6 +188,41 @@ class TestCliHelp:
         assert result.exit_code == 0
         assert __version__ in result.output
 
+    def test_help_does_not_import_command_modules(self) -> None:
+        """Test that --help lists commands without importing their modules."""
+        output, imported = _run_cli_in_subprocess(["--help"])
+
+        assert "review" in output
+        assert imported == []
+
+    def test_completing_commands_does_not_import_command_modules(self) -> None:
+        """Test that shell completion of command names imports no command module."""
+        output, imported = _run_cli_in_subprocess(
+            [],
+            env={"_RALPH_COMPLETE": "complete_bash", "COMP_WORDS": "ralph ", "COMP_CWORD": "1"},
+        )
+
+        assert output.split() == ["init", "prd", "tasks", "once", "loop", "sync", "review"]
+        assert imported == []
+
+    def test_running_a_command_imports_only_that_module(self) -> None:
+        """Test that invoking one command imports only that command's module."""
+        _, imported = _run_cli_in_subprocess(["sync", "--help"])
+
+        assert imported == ["ralph.commands.sync"]
+
+    def test_launcher_version_fast_path(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that the launcher prints the version without running the Typer app."""
+        from ralph.__main__ import main
+
+        monkeypatch.setattr("sys.argv", ["ralph", "--version"])
+
+        main()
+
+        assert capsys.readouterr().out == f"ralph {__version__}\n"
+
 
 class TestInitCommand:
     """Integration tests for ralph init command."""
@@ -209,6 +287,58 @@ class TestInitCommand:
         # Verify the skip message is shown
         assert "Skipping PRD creation" in result.output
 
+    def test_check_existing_files_reports_present_files(self, tmp_path: Path) -> None:
+        """Test that _check_existing_files lists only files that exist, in order."""
+        from ralph.commands.init_cmd import _check_existing_files
+
+        assert _check_existing_files(tmp_path) == []
+
+        (tmp_path / "plans").mkdir()
+        (tmp_path / "plans" / "TASKS.json").write_text("{}")
+        (tmp_path / "CHANGELOG.md").write_text("# Changelog")
+        (tmp_path / "CLAUDE.md").write_text("# Claude")
+
+        assert _check_existing_files(tmp_path) == [
+            "plans/TASKS.json",
+            "CLAUDE.md",
+            "CHANGELOG.md",
+        ]
+
+    def test_check_existing_files_ignores_plans_file(self, tmp_path: Path) -> None:
+        """Test that a plain file named plans is not treated as the plans directory."""
+        from ralph.commands.init_cmd import _check_existing_files
+
+        (tmp_path / "plans").write_text("not a directory")
+
+        assert _check_existing_files(tmp_path) == []
+
+    def test_init_refuses_to_overwrite_without_force(
+        self, runner: CliRunner, python_project: Path
+    ) -> None:
+        """Test that init exits when workflow files exist and --force is not given."""
+        (python_project / "CLAUDE.md").write_text("# Existing")
+
+        with working_directory(python_project):
+            result = runner.invoke(app, ["init", "--skip-claude"])
+
+        assert result.exit_code == 1
+        assert "CLAUDE.md" in result.output
+        assert (python_project / "CLAUDE.md").read_text() == "# Existing"
+
+    def test_init_force_skips_existing_file_check(
+        self, runner: CliRunner, python_project: Path
+    ) -> None:
+        """Test that --force does not scan for existing workflow files."""
+        (python_project / "CLAUDE.md").write_text("# Existing")
+
+        with working_directory(python_project):
+            with patch("ralph.commands.init_cmd._check_existing_files") as mock_check:
+                result = runner.invoke(app, ["init", "--skip-claude", "--force"])
+
+        assert result.exit_code == 0
+        mock_check.assert_not_called()
+        assert (python_project / "CLAUDE.md").read_text() != "# Existing"
+
 
 class TestHandleMissingPrd:
     """Unit tests for _handle_missing_prd function."""
@@ -253,6 +383,47 @@ class TestHandleMissingPrd:
         mock_confirm.assert_called_once()
 
 
+class TestHasPrdContent:
+    """Unit tests for _has_prd_content function."""
+
+    def test_scaffolded_template_has_no_content(self, tmp_path: Path) -> None:
+        """Test that the untouched SPEC.md template is treated as empty."""
+        from ralph.commands.init_cmd import _has_prd_content
+        from ralph.services import ScaffoldService
+
+        ScaffoldService(project_root=tmp_path).scaffold_all()
+
+        assert _has_prd_content(tmp_path / "plans" / "SPEC.md") is False
+
+    def test_filled_in_spec_has_content(self, tmp_path: Path) -> None:
+        """Test that a section with real text counts as content."""
+        from ralph.commands.init_cmd import _has_prd_content
+
+        prd_path = tmp_path / "SPEC.md"
+        prd_path.write_text("# Feature\n\n## Overview\n\n### Details\n\nBuild a todo app.\n")
+
+        assert _has_prd_content(prd_path) is True
+
+    def test_headings_and_placeholders_only_have_no_content(self, tmp_path: Path) -> None:
+        """Test that sections holding only headings or bracketed text are empty."""
+        from ralph.commands.init_cmd import _has_prd_content
+
+        prd_path = tmp_path / "SPEC.md"
+        prd_path.write_text("# Feature\n\n## Overview\n\n[To be written]\n\n## Goals\n")
+
+        assert _has_prd_content(prd_path) is False
+
+    def test_marker_past_prefix_is_still_detected(self, tmp_path: Path) -> None:
+        """Test that a template marker beyond the prefix read is still found."""
+        from ralph.commands.init_cmd import _has_prd_content
+
+        prd_path = tmp_path / "SPEC.md"
+        filler = "Real text.\n" * 1000
+        prd_path.write_text(f"# Feature\n\n## Overview\n\n{filler}\n## Goals\n\n- [Goal 1]\n")
+
+        assert _has_prd_content(prd_path) is False
+
+
 class TestPrdCommand:
     """Integration tests for ralph prd command."""
 
@@ -290,6 +461,53 @@ class TestPrdCommand:
         assert "append_system_prompt" in captured_kwargs
         assert captured_kwargs.get("append_system_prompt") is not None
 
+    def test_prd_rejects_oversized_feature_file(
+        self, runner: CliRunner, project_with_skill: Path
+    ) -> None:
+        """Test that ralph prd --file refuses a file over the size limit."""
+        from ralph.commands.prd import MAX_FEATURE_FILE_BYTES
+
+        feature_file = project_with_skill / "feature.md"
+        feature_file.write_bytes(b"x" * (MAX_FEATURE_FILE_BYTES + 1))
+
+        with working_directory(project_with_skill):
+            with patch("ralph.commands.prd.ClaudeService") as mock_claude:
+                result = runner.invoke(app, ["prd", "--file", "feature.md"])
+
+        assert result.exit_code == 1
+        assert "File too large" in result.output
+        mock_claude.assert_not_called()
+
+    def test_prd_checks_custom_output_directory(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test that ralph prd checks the --output directory rather than plans/."""
+        (tmp_path / "docs").mkdir()
+
+        with working_directory(tmp_path):
+            with patch("ralph.commands.prd.ClaudeService") as mock_claude:
+                mock_claude.return_value.run_interactive.return_value = 0
+                result = runner.invoke(app, ["prd", "--output", "docs/SPEC.md"])
+                missing = runner.invoke(app, ["prd", "--output", "specs/SPEC.md"])
+
+        assert result.exit_code == 0
+        assert missing.exit_code == 1
+        assert "specs/ directory not found" in missing.output
+
+    def test_file_signature_detects_rewrite_with_unchanged_mtime(self, tmp_path: Path) -> None:
+        """Test that a same-mtime rewrite still changes the PRD file signature."""
+        from ralph.commands.prd import _get_file_signature
+
+        spec = tmp_path / "SPEC.md"
+        assert _get_file_signature(spec) is None
+
+        spec.write_text("# Draft")
+        before = _get_file_signature(spec)
+        assert before is not None
+
+        spec.write_text("# Draft with more detail")
+        os.utime(spec, ns=(before[0], before[0]))
+
+        assert _get_file_signature(spec) != before
+
 
 class TestTasksCommand:
     """Integration tests for ralph tasks command."""
@@ -419,6 +637,35 @@ class TestOnceCommand:
         prompt_idx = captured_args.index("--append-system-prompt")
         assert captured_args[prompt_idx + 1] == ClaudeService.AUTONOMOUS_MODE_PROMPT
 
+    def test_find_next_story_picks_first_lowest_priority_incomplete(self) -> None:
+        """Test that _find_next_story skips passing stories and keeps file order on ties."""
+        from ralph.commands.once import _find_next_story
+        from ralph.models import TasksFile, UserStory
+
+        def story(story_id: str, priority: int, passes: bool = False) -> UserStory:
+            return UserStory(
+                id=story_id, title=story_id, description="D", priority=priority, passes=passes
+            )
+
+        tasks = TasksFile(
+            project="TestProject",
+            branch_name="ralph/test-feature",
+            description="Test",
+            user_stories=[
+                story("US-001", 1, passes=True),
+                story("US-002", 2),
+                story("US-003", 2),
+            ],
+        )
+
+        next_story = _find_next_story(tasks)
+        assert next_story is not None
+        assert next_story.id == "US-002"
+
+        for s in tasks.user_stories:
+            s.passes = True
+        assert _find_next_story(tasks) is None
+
 
 class TestLoopCommand:
     """Integration tests for ralph loop command."""
@@ -447,6 +694,7 @@ class TestLoopCommand:
             with (
                 patch("subprocess.Popen", side_effect=mock_popen),
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
             ):
                 result = runner.invoke(app, ["loop", "1"])
 
@@ -483,6 +731,7 @@ class TestLoopCommand:
             with (
                 patch("subprocess.Popen", side_effect=mock_popen),
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
             ):
                 result = runner.invoke(app, ["loop", "1", "--skip-review"])
 
@@ -511,6 +760,7 @@ class TestLoopCommand:
             with (
                 patch("subprocess.Popen", side_effect=mock_popen),
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
             ):
                 result = runner.invoke(app, ["loop", "1", "--strict"])
 
@@ -541,6 +791,7 @@ class TestLoopCommand:
             with (
                 patch("subprocess.Popen", side_effect=mock_popen),
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
             ):
                 result = runner.invoke(app, ["loop", "1", "--skip-review", "--strict"])
 
@@ -595,6 +846,7 @@ class TestLoopCommand:
             with (
                 patch("subprocess.Popen", side_effect=mock_popen),
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("ralph.commands.loop._run_review_loop", return_value=True) as mock_review,
             ):
                 result = runner.invoke(app, ["loop", "1"])
@@ -603,6 +855,43 @@ class TestLoopCommand:
         mock_review.assert_called_once()
         assert "All stories complete" in result.output
 
+    def test_loop_skips_review_loop_when_branch_changed_in_final_iteration(
+        self, runner: CliRunner, project_with_tasks: Path
+    ) -> None:
+        """Test that ralph loop re-checks the branch before starting reviews."""
+
+        def mock_popen(args: list[str], **kwargs: Any) -> MagicMock:
+            mock_process = MagicMock()
+            json_output = json.dumps(
+                {
+                    "type": "assistant",
+                    "message": {
+                        "content": [{"type": "text", "text": "Story done <ralph>COMPLETE</ralph>"}]
+                    },
+                }
+            )
+            mock_process.stdout = StringIO(json_output + "\n")
+            mock_process.stderr = StringIO("")
+            mock_process.wait.return_value = 0
+            return mock_process
+
+        with working_directory(project_with_tasks):
+            with (
+                patch("subprocess.Popen", side_effect=mock_popen),
+                patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
+                patch(
+                    "ralph.commands.loop._check_branch_unchanged",
+                    side_effect=[(None, False), (None, True)],
+                ),
+                patch("ralph.commands.loop._run_review_loop") as mock_review,
+            ):
+                result = runner.invoke(app, ["loop", "1"])
+
+        assert result.exit_code == 0
+        mock_review.assert_not_called()
+        assert "feature branch not checked out" in result.output
+
     def test_loop_skips_review_loop_with_skip_review_flag(
         self, runner: CliRunner, project_with_tasks: Path
     ) -> None:
@@ -627,6 +916,7 @@ class TestLoopCommand:
             with (
                 patch("subprocess.Popen", side_effect=mock_popen),
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("ralph.commands.loop._run_review_loop") as mock_review,
             ):
                 result = runner.invoke(app, ["loop", "1", "--skip-review"])
@@ -664,6 +954,7 @@ class TestLoopCommand:
             with (
                 patch("subprocess.Popen", side_effect=mock_popen),
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("ralph.commands.loop._run_review_loop", side_effect=capture_review_call),
             ):
                 result = runner.invoke(app, ["loop", "1", "--strict"])
@@ -693,6 +984,7 @@ class TestLoopCommand:
             with (
                 patch("subprocess.Popen", side_effect=mock_popen),
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("ralph.commands.loop._run_review_loop", return_value=False),
             ):
                 result = runner.invoke(app, ["loop", "1"])
@@ -700,6 +992,112 @@ class TestLoopCommand:
         assert result.exit_code == 0  # Still exit 0 since stories passed
         assert "Review loop completed with failures" in result.output
 
+    def test_loop_detects_complete_tag_split_across_deltas(
+        self, runner: CliRunner, project_with_tasks: Path
+    ) -> None:
+        """Test that ralph loop finds the COMPLETE tag when streamed in pieces."""
+
+        def mock_popen(args: list[str], **kwargs: Any) -> MagicMock:
+            mock_process = MagicMock()
+            deltas = ["Story done <ral", "ph>COMP", "LETE</ralph>"]
+            lines = [
+                json.dumps(
+                    {
+                        "type": "content_block_delta",
+                        "delta": {"type": "text_delta", "text": text},
+                    }
+                )
+                for text in deltas
+            ]
+            mock_process.stdout = StringIO("\n".join(lines) + "\n")
+            mock_process.stderr = StringIO("")
+            mock_process.wait.return_value = 0
+            return mock_process
+
+        with working_directory(project_with_tasks):
+            with (
+                patch("subprocess.Popen", side_effect=mock_popen),
+                patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
+            ):
+                result = runner.invoke(app, ["loop", "1", "--skip-review"])
+
+        assert result.exit_code == 0
+        assert "All stories complete" in result.output
+
+    def test_check_branch_unchanged_queries_git_only_after_head_changes(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that the branch is re-checked only when .git/HEAD is rewritten."""
+        from ralph.commands.loop import _check_branch_unchanged, _head_mtime_ns
+
+        git_dir = tmp_path / ".git"
+        head = git_dir / "HEAD"
+        head.parent.mkdir()
+        head.write_text("ref: refs/heads/ralph/test-feature\n")
+        mock_git = MagicMock()
+        mtime_ns = _head_mtime_ns(git_dir)
+
+        assert _check_branch_unchanged(mock_git, git_dir, "ralph/test-feature", mtime_ns) == (
+            mtime_ns,
+            False,
+        )
+        mock_git.get_current_branch.assert_not_called()
+
+        assert mtime_ns is not None
+        os.utime(head, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+        mock_git.get_current_branch.return_value = "main"
+
+        new_mtime_ns, should_break = _check_branch_unchanged(
+            mock_git, git_dir, "ralph/test-feature", mtime_ns
+        )
+
+        assert should_break is True
+        assert new_mtime_ns == mtime_ns + 1_000_000_000
+
+    def test_check_branch_unchanged_queries_git_when_head_unreadable(self) -> None:
+        """Test that an unknown HEAD time counts as changed rather than unchanged."""
+        from ralph.commands.loop import _check_branch_unchanged
+
+        mock_git = MagicMock()
+        mock_git.get_current_branch.return_value = "main"
+
+        assert _check_branch_unchanged(mock_git, None, "ralph/test-feature", None) == (None, True)
+        mock_git.get_current_branch.assert_called_once()
+
+    def test_loop_detects_branch_switch_from_subdirectory(
+        self, runner: CliRunner, project_with_tasks: Path
+    ) -> None:
+        """Test that the branch guard works when ralph runs below the repo root."""
+        from ralph.commands.loop import IterationOutcome
+
+        repo = project_with_tasks
+        app_dir = repo / "app"
+        app_dir.mkdir()
+        (repo / "plans").rename(app_dir / "plans")
+        subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+        subprocess.run(
+            ["git", "symbolic-ref", "HEAD", "refs/heads/ralph/test-feature"], cwd=repo, check=True
+        )
+
+        def switch_branch(**kwargs: Any) -> IterationOutcome:
+            subprocess.run(["git", "checkout", "-q", "-b", "other"], cwd=repo, check=True)
+            head = repo / ".git" / "HEAD"
+            bumped_ns = head.stat().st_mtime_ns + 1_000_000_000
+            os.utime(head, ns=(bumped_ns, bumped_ns))
+            return IterationOutcome.FAILED
+
+        with working_directory(app_dir):
+            with (
+                patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop._execute_story", side_effect=switch_branch),
+            ):
+                result = runner.invoke(app, ["loop", "2", "--skip-review"])
+
+        assert result.exit_code == 1
+        assert "Branch changed to 'other'" in result.output
+        assert GitService(working_dir=app_dir).get_git_dir() == (repo / ".git").resolve()
+
 
 class TestSyncCommand:
     """Integration tests for ralph sync command."""
@@ -1036,6 +1434,36 @@ class TestInitGitInitialization:
 
         assert _is_git_repo(tmp_path) is False
 
+    def test_is_git_repo_finds_repo_from_subdirectory(self, tmp_path: Path) -> None:
+        """Test that _is_git_repo walks up to find an enclosing repository."""
+        from ralph.commands.init_cmd import _is_git_repo
+
+        (tmp_path / ".git").mkdir()
+        nested = tmp_path / "src" / "pkg"
+        nested.mkdir(parents=True)
+
+        assert _is_git_repo(nested) is True
+
+    def test_is_git_repo_accepts_gitdir_file(self, tmp_path: Path) -> None:
+        """Test that a worktree-style .git file counts as a repository."""
+        from ralph.commands.init_cmd import _is_git_repo
+
+        (tmp_path / ".git").write_text("gitdir: /elsewhere/.git/worktrees/wt\n")
+
+        assert _is_git_repo(tmp_path) is True
+
+    def test_find_git_dir_follows_relative_gitdir_pointer(self, tmp_path: Path) -> None:
+        """Test that a relative gitdir pointer resolves against the .git file."""
+        from ralph.services import find_git_dir
+
+        worktree = tmp_path / "feature"
+        nested = worktree / "src"
+        nested.mkdir(parents=True)
+        (worktree / ".git").write_text("gitdir: ../main/.git/worktrees/feature\n")
+
+        assert find_git_dir(nested) == worktree.resolve() / "../main/.git/worktrees/feature"
+        assert find_git_dir(tmp_path) is None
+
     def test_init_git_repo_creates_git_directory(self, tmp_path: Path) -> None:
         """Test that _init_git_repo creates a .git directory."""
         from ralph.commands.init_cmd import _init_git_repo
@@ -1310,6 +1738,7 @@ reviewers:
         with working_directory(project_with_pending_story):
             with (
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("subprocess.Popen", side_effect=mock_story_popen),
                 patch("ralph.services.review_loop.ClaudeService") as mock_claude_class,
             ):
@@ -1351,6 +1780,7 @@ reviewers:
         with working_directory(project_with_pending_story):
             with (
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("subprocess.Popen", side_effect=mock_story_popen),
                 patch("ralph.services.review_loop.ClaudeService") as mock_claude_class,
             ):
@@ -1391,6 +1821,7 @@ reviewers:
         with working_directory(project_with_pending_story):
             with (
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("subprocess.Popen", side_effect=mock_story_popen),
                 patch("ralph.services.review_loop.ClaudeService") as mock_claude_class,
             ):
@@ -1486,6 +1917,7 @@ reviewers:
         with working_directory(tmp_path):
             with (
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("subprocess.Popen", side_effect=mock_story_popen),
                 patch("ralph.services.review_loop.ClaudeService") as mock_claude_class,
             ):
@@ -1526,6 +1958,7 @@ reviewers:
         with working_directory(project_with_pending_story):
             with (
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("subprocess.Popen", side_effect=mock_story_popen),
                 patch("ralph.services.review_loop.ClaudeService") as mock_claude_class,
             ):
@@ -1564,6 +1997,7 @@ reviewers:
         with working_directory(project_with_pending_story):
             with (
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("subprocess.Popen", side_effect=mock_story_popen),
                 patch("ralph.services.review_loop.ClaudeService") as mock_claude_class,
             ):
@@ -1612,6 +2046,7 @@ reviewers:
         with working_directory(project_with_pending_story):
             with (
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("subprocess.Popen", side_effect=mock_story_popen),
                 patch("ralph.services.review_loop.ClaudeService") as mock_claude_class,
             ):
@@ -1659,6 +2094,7 @@ reviewers:
         with working_directory(project_with_pending_story):
             with (
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("subprocess.Popen", side_effect=mock_story_popen),
                 patch("ralph.services.review_loop.ClaudeService") as mock_claude_class,
             ):
@@ -1698,6 +2134,7 @@ reviewers:
         with working_directory(project_with_pending_story):
             with (
                 patch("ralph.commands.loop._setup_branch", return_value=True),
+                patch("ralph.commands.loop.GitService", return_value=_feature_branch_git()),
                 patch("subprocess.Popen", side_effect=mock_story_popen),
                 patch("ralph.services.review_loop.ClaudeService") as mock_claude_class,
             ):
@@ -1773,3 +2210,62 @@ class TestPrintReviewStep:
         assert "[Review 1/5]" in review_text
         assert "test message" in step_text
         assert "test message" in review_text
+
+
+class TestCreateConsole:
+    """Tests for create_console terminal detection."""
+
+    def test_disables_highlighting_when_stdout_redirected(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a console for redirected stdout does not auto-highlight."""
+        from ralph.utils.console import create_console
+
+        monkeypatch.delenv("FORCE_COLOR", raising=False)
+        monkeypatch.setattr("sys.stdout", StringIO())
+
+        console = create_console()
+
+        assert console.render_str("took 42 seconds").spans == []
+
+    def test_keeps_highlighting_when_color_forced(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that FORCE_COLOR keeps highlighting for redirected stdout."""
+        from ralph.utils.console import create_console
+
+        monkeypatch.setenv("FORCE_COLOR", "1")
+        monkeypatch.setattr("sys.stdout", StringIO())
+
+        console = create_console()
+
+        assert console.render_str("took 42 seconds").spans != []
+
+    def test_highlighting_follows_rich_terminal_detection(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that highlighting is on exactly when Rich treats stdout as a terminal."""
+        from ralph.utils.console import create_console
+
+        monkeypatch.delenv("FORCE_COLOR", raising=False)
+        monkeypatch.setenv("TTY_COMPATIBLE", "1")
+        monkeypatch.setattr("sys.stdout", StringIO())
+
+        console = create_console()
+
+        assert (console.render_str("took 42 seconds").spans != []) is console.is_terminal
+
+
+class TestClaudeServiceCliPath:
+    """Tests for ClaudeService CLI path resolution."""
+
+    def test_resolves_cli_path_once_per_instance(self) -> None:
+        """Test that repeated runs on one service look up the CLI path once."""
+        from ralph.services import ClaudeService
+
+        claude = ClaudeService()
+
+        with patch("shutil.which", return_value="/usr/bin/claude") as mock_which:
+            first = claude._build_base_args()
+            second = claude._build_base_args(skip_permissions=False)
+
+        assert first[0] == second[0] == "/usr/bin/claude"
+        mock_which.assert_called_once_with("claude")
@@ -73,6 +73,10 @@ class TestLanguageDetector:
 
         assert LanguageDetector(project_root=tmp_path).detect() == set()
 
+    def test_returns_empty_set_for_missing_root(self, tmp_path: Path) -> None:
+        """Test empty set returned when the project root does not exist."""
+        assert LanguageDetector(project_root=tmp_path / "missing").detect() == set()
+
 
 class TestDetectLanguagesFunction:
     """Tests for the detect_languages convenience function."""
@@ -197,6 +197,49 @@ class TestReviewSubsequentRun:
         assert "Suggested reviewers not in current config" not in result.output
         assert "ralph review --force" not in result.output
 
+    def test_no_reviewers_exits_without_running_service(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test that an empty reviewer config exits before detecting languages."""
+        _setup_tmp_project(tmp_path)
+
+        with working_directory(tmp_path):
+            with (
+                patch("ralph.commands.review.has_reviewer_config", return_value=True),
+                patch("ralph.commands.review.load_reviewer_configs", return_value=[]),
+                patch("ralph.commands.review.detect_reviewers", return_value=[]),
+                patch("ralph.commands.review.detect_languages") as mock_detect_languages,
+                patch("ralph.commands.review.ReviewLoopService") as mock_cls,
+            ):
+                result = runner.invoke(app, ["review"])
+
+        assert result.exit_code == 0
+        assert "No reviewers configured" in result.output
+        mock_detect_languages.assert_not_called()
+        mock_cls.assert_not_called()
+
+    def test_no_reviewers_cleans_up_state_file(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test that an empty reviewer config still removes a leftover state file."""
+        _setup_tmp_project(tmp_path)
+        state = ReviewState(
+            reviewer_names=["test-quality"],
+            completed={"test-quality": True},
+            timestamp="2026-02-08T10:00:00Z",
+            config_hash="stale_hash",
+        )
+        state.save(tmp_path / REVIEW_STATE_FILENAME)
+
+        with working_directory(tmp_path):
+            with (
+                patch("ralph.commands.review.has_reviewer_config", return_value=True),
+                patch("ralph.commands.review.load_reviewer_configs", return_value=[]),
+                patch("ralph.commands.review.detect_reviewers", return_value=[]),
+            ):
+                result = runner.invoke(app, ["review"])
+
+        assert result.exit_code == 0
+        assert not (tmp_path / REVIEW_STATE_FILENAME).exists()
+
 
 class TestReviewForceFlag:
     """Tests for --force flag updating existing configuration."""
@@ -267,6 +310,41 @@ class TestReviewForceFlag:
         assert "First run detected" in result.output
         mock_write.assert_called_once()
 
+    def test_language_skipped_reviewers_logged_before_next_run(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test that consecutive skipped reviewers are logged together before the next run."""
+        _setup_tmp_project(tmp_path)
+        reviewers = _make_reviewers(["bicep", "go-code", "code-simplifier"])
+
+        with working_directory(tmp_path):
+            with (
+                patch("ralph.commands.review.has_reviewer_config", return_value=True),
+                patch("ralph.commands.review.load_reviewer_configs", return_value=reviewers),
+                patch("ralph.commands.review.detect_reviewers", return_value=reviewers),
+                patch("ralph.commands.review.detect_languages", return_value=set()),
+                patch("ralph.commands.review.ReviewLoopService") as mock_cls,
+            ):
+                mock_service = _make_mock_service()
+                mock_service.should_run_reviewer.side_effect = [False, False, True]
+                skipped_batches: list[list[str]] = []
+
+                def record_batch(progress_path: Path, batch: list[ReviewerConfig]) -> None:
+                    skipped_batches.append([r.name for r in batch])
+
+                mock_service._append_skipped_summaries.side_effect = record_batch
+                mock_cls.return_value = mock_service
+                result = runner.invoke(app, ["review"])
+
+        assert result.exit_code == 0
+        call_names = [
+            name
+            for name, *_ in mock_service.mock_calls
+            if name in ("_append_skipped_summaries", "run_reviewer")
+        ]
+        assert call_names[:2] == ["_append_skipped_summaries", "run_reviewer"]
+        assert skipped_batches[0] == ["bicep", "go-code"]
+
 
 class TestReviewStrictFlag:
     """Tests for --strict flag pass-through to review loop."""
@@ -370,6 +370,25 @@ class TestAppendReviewSummary:
         assert "[Review Loop]" in content
         assert "skipped (language filter)" in content
 
+    def test_logs_several_skipped_reviewers_in_order(self, tmp_path: Path) -> None:
+        """Test _append_skipped_summaries writes one note per reviewer, in order."""
+        progress_file = tmp_path / "PROGRESS.txt"
+        progress_file.write_text("# Progress\n")
+
+        service = _create_service(tmp_path)
+        reviewers = [
+            _create_reviewer(name="python-code", level=ReviewerLevel.blocking),
+            _create_reviewer(name="go-code", level=ReviewerLevel.warning),
+        ]
+
+        service._append_skipped_summaries(progress_file, reviewers)
+        service._append_skipped_summaries(progress_file, [])
+
+        content = progress_file.read_text()
+        assert len(reviewers) == 2
+        assert content.count("skipped (language filter)") == 2
+        assert content.index("python-code (blocking)") < content.index("go-code (warning)")
+
 
 class TestShouldRunFixLoop:
     """Tests for should_run_fix_loop method."""
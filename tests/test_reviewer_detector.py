@@ -1,6 +1,8 @@
 """Tests for reviewer detection service."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 from ralph.models.reviewer import ReviewerLevel
 from ralph.services import ReviewerDetector, detect_reviewers
@@ -139,6 +141,20 @@ class TestReviewerDetector:
 
         assert "test-quality" in names
 
+    def test_ignores_files_in_dependency_directories(self, tmp_path: Path) -> None:
+        """Test that files under node_modules or .venv do not trigger reviewers."""
+        for excluded in ("node_modules/pkg", ".venv/lib"):
+            excluded_dir = tmp_path / excluded
+            excluded_dir.mkdir(parents=True)
+            (excluded_dir / "test_helper.py").write_text("def test(): pass\n")
+            (excluded_dir / "main.bicep").write_text("param location string\n")
+
+        names = [r.name for r in ReviewerDetector(project_root=tmp_path).detect_reviewers()]
+
+        assert "python-code" not in names
+        assert "test-quality" not in names
+        assert "bicep" not in names
+
     def test_detects_changelog_adds_release_reviewer(self, tmp_path: Path) -> None:
         """Test release reviewer added when CHANGELOG.md exists."""
         (tmp_path / "CHANGELOG.md").write_text("# Changelog\n")
@@ -177,6 +193,18 @@ class TestReviewerDetector:
         assert "test-quality" in names
         assert "release" in names
 
+    def test_scan_stops_once_all_file_kinds_found(self, tmp_path: Path) -> None:
+        """Test the source scan does not descend further once every kind is found."""
+        (tmp_path / "test_main.py").write_text("def test(): pass\n")
+        (tmp_path / "main.bicep").write_text("param location string\n")
+        (tmp_path / "src").mkdir()
+        detector = ReviewerDetector(project_root=tmp_path)
+
+        with patch("ralph.services.reviewer_detector.os.scandir", wraps=os.scandir) as mock_scan:
+            assert detector._scan_source_files() == (True, True, True)
+
+        mock_scan.assert_called_once()
+
 
 class TestDetectReviewersFunction:
     """Tests for the detect_reviewers convenience function."""
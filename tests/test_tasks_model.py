@@ -12,7 +12,7 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
-from ralph.models import TasksFile, UserStory, load_tasks, save_tasks
+from ralph.models import TasksFile, UserStory, load_tasks, load_tasks_cached, save_tasks
 
 
 class TestUserStory:
@@ -64,6 +64,23 @@ class TestTasksFile:
         assert tasks.branch_name == "ralph/test-feature"
         assert tasks.user_stories[0].acceptance_criteria == ["AC1"]
 
+    def test_stories_by_id_indexes_stories(self) -> None:
+        """Test that stories_by_id maps IDs to stories, keeping the first duplicate."""
+        first = UserStory(id="US-001", title="First", description="D", priority=1)
+        second = UserStory(id="US-002", title="Second", description="D", priority=2)
+        duplicate = UserStory(id="US-001", title="Duplicate", description="D", priority=3)
+        tasks = TasksFile(
+            project="TestProject",
+            branch_name="ralph/test-feature",
+            description="Testing index",
+            user_stories=[first, second, duplicate],
+        )
+
+        assert tasks.stories_by_id["US-002"] is second
+        assert tasks.stories_by_id["US-001"] is first
+        assert "US-003" not in tasks.stories_by_id
+        assert "stories_by_id" not in tasks.model_dump()
+
 
 class TestLoadSaveTasks:
     """Tests for load_tasks and save_tasks functions."""
@@ -138,3 +155,25 @@ class TestLoadSaveTasks:
         loaded = load_tasks(tasks_file)
         assert loaded.project == original.project
         assert loaded.user_stories[0].passes == original.user_stories[0].passes
+
+    def test_load_tasks_cached_reparses_only_when_file_changes(self, tmp_path: Path) -> None:
+        """Test that load_tasks_cached re-parses only when the file changes."""
+        tasks_file = tmp_path / "TASKS.json"
+        save_tasks(
+            TasksFile(
+                project="Cached",
+                branch_name="ralph/cached",
+                description="Testing cache",
+                user_stories=[UserStory(id="US-001", title="T", description="D", priority=1)],
+            ),
+            tasks_file,
+        )
+
+        first = load_tasks_cached(tasks_file)
+        assert load_tasks_cached(tasks_file) is first
+
+        data = json.loads(tasks_file.read_text())
+        data["userStories"][0]["passes"] = True
+        tasks_file.write_text(json.dumps(data))
+
+        assert load_tasks_cached(tasks_file).user_stories[0].passes is True